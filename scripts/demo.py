@@ -33,7 +33,7 @@ async def demo_api_client():
         # Get committees with models
         logger.info(f"\\n🏛️  Fetching House Committees...")
         committees_data = await client.get_committees(congress=118, chamber="house", limit=3)
-        committees = CommitteeList(**committees_data)
+        committees = CommitteeList.from_response(committees_data)
         
         for committee in committees.committees:
             logger.info(f"  • {committee.name}")
@@ -43,7 +43,7 @@ async def demo_api_client():
         # Get recent bills
         logger.info(f"\\n📜 Recent Bills...")
         bills_data = await client.get_bills(congress=118, limit=2)
-        bills = BillList(**bills_data)
+        bills = BillList.from_response(bills_data)
         
         for bill in bills.bills:
             logger.info(f"  • {bill.get_bill_identifier()}: {bill.title}")
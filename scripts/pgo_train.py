@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Profile-guided optimization workload for the pydantic-core build.
+
+Replays recorded Congress API list responses through the same parse and
+serialize calls the server makes, so that an instrumented pydantic-core
+build collects a profile of this project's workload. Used by the pgo-build
+stage of the Dockerfile.
+
+Usage:
+    python scripts/pgo_train.py --record pgo-samples   # fetch samples (needs CONGRESS_API_KEY)
+    python scripts/pgo_train.py pgo-samples            # replay samples
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from congress_mcp.models import BillList, CommitteeList, HearingList, MemberList
+
+# Sample sub-directory -> list model its responses are parsed into
+SAMPLE_MODELS = {
+    "bills": BillList,
+    "committees": CommitteeList,
+    "hearings": HearingList,
+    "members": MemberList
+}
+
+
+async def record_samples(sample_dir: Path, pages: int) -> None:
+    """Save raw list response bodies from the Congress API into sample_dir."""
+    from congress_mcp.api import CongressAPIClient
+    
+    async with CongressAPIClient() as client:
+        fetchers = {
+            "bills": client.get_bills,
+            "committees": client.get_committees,
+            "hearings": client.get_committee_hearings,
+            "members": client.get_members
+        }
+        for kind, fetch in fetchers.items():
+            kind_dir = sample_dir / kind
+            kind_dir.mkdir(parents=True, exist_ok=True)
+            for page in range(pages):
+                body = await fetch(limit=250, offset=page * 250, raw=True)
+                if isinstance(body, str):
+                    body = body.encode()
+                (kind_dir / f"{page:03d}.json").write_bytes(body)
+            print(f"Recorded {pages} {kind} pages")
+
+
+def replay_samples(sample_dir: Path, rounds: int) -> int:
+    """Parse and serialize every recorded sample; returns the number of bodies replayed."""
+    samples = [
+        (SAMPLE_MODELS[kind], path.read_bytes())
+        for kind in SAMPLE_MODELS
+        for path in sorted((sample_dir / kind).glob("*.json"))
+    ]
+    if not samples:
+        raise SystemExit(f"No samples found under {sample_dir}; record some with --record")
+    
+    for _ in range(rounds):
+        for model, body in samples:
+            response = model.parse_list(body)
+            response.model_dump_json()
+            response.model_dump()
+    return len(samples)
+
+
+def main():
+    """Record or replay the PGO training samples."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sample_dir", type=Path, help="Directory of recorded response bodies")
+    parser.add_argument("--record", action="store_true", help="Fetch new samples instead of replaying")
+    parser.add_argument("--pages", type=int, default=4, help="Pages of 250 records to record per endpoint")
+    parser.add_argument("--rounds", type=int, default=20, help="Times to replay the sample set")
+    args = parser.parse_args()
+    
+    if args.record:
+        asyncio.run(record_samples(args.sample_dir, args.pages))
+        return
+    
+    start = time.perf_counter()
+    count = replay_samples(args.sample_dir, args.rounds)
+    print(f"Replayed {count} samples x {args.rounds} rounds in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -40,7 +40,7 @@ async def test_models():
                 limit=3
             )
             
-            committees = CommitteeList(**committees_data)
+            committees = CommitteeList.from_response(committees_data)
             logger.info(f"Parsed {len(committees.committees)} committees")
             
             for committee in committees.committees[:2]:
@@ -56,7 +56,7 @@ async def test_models():
                 limit=3
             )
             
-            hearings = HearingList(**hearings_data)
+            hearings = HearingList.from_response(hearings_data)
             logger.info(f"Parsed {len(hearings.hearings)} hearings")
             
             for hearing in hearings.hearings[:2]:
@@ -74,7 +74,7 @@ async def test_models():
                 limit=3
             )
             
-            bills = BillList(**bills_data)
+            bills = BillList.from_response(bills_data)
             logger.info(f"Parsed {len(bills.bills)} bills")
             
             for bill in bills.bills[:2]:
@@ -93,7 +93,7 @@ async def test_models():
                 limit=3
             )
             
-            members = MemberList(**members_data)
+            members = MemberList.from_response(members_data)
             logger.info(f"Parsed {len(members.members)} members")
             
             for member in members.members[:2]:
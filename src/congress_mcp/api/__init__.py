@@ -5,6 +5,7 @@ Congress API client and utilities.
 from .client import CongressAPIClient, CongressAPIError, create_client
 from .rate_limiter import RateLimiter, rate_limiter
 from .search import CongressSearchEngine, SearchResult
+from .batcher import ToolCallBatcher
 
 __all__ = [
     "CongressAPIClient",
@@ -13,5 +14,6 @@ __all__ = [
     "RateLimiter",
     "rate_limiter",
     "CongressSearchEngine",
-    "SearchResult"
+    "SearchResult",
+    "ToolCallBatcher"
 ]
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+Request coalescing for Congress API calls made by MCP tool handlers.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..utils.logging import logger
+from .client import CongressAPIClient, CongressAPIError
+
+
+class ToolCallBatcher:
+    """
+    Coalesces bursts of Congress API calls into concurrent batches.
+    
+    Calls submitted within ``flush_interval`` seconds of each other (or until
+    ``max_batch`` calls are queued) are flushed together: identical calls share
+    a single upstream request and distinct calls run concurrently. A call
+    that finds the queue otherwise empty is flushed without waiting. Every
+    request still goes through the client, so the shared rate limiter applies.
+    """
+    
+    def __init__(
+        self,
+        client: CongressAPIClient,
+        flush_interval: float = 0.005,
+        max_batch: int = 16
+    ):
+        self.client = client
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+    
+    async def submit(self, method: str, **params) -> Dict[str, Any]:
+        """
+        Queue a client call and wait for its result.
+        
+        Args:
+            method: Name of the CongressAPIClient method to call
+            **params: Keyword arguments for the method
+        
+        Returns:
+            The method's API response data
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and self._worker.get_loop() is not loop:
+            # The previous event loop is gone along with its worker and queue
+            self._worker = None
+            self._queue = asyncio.Queue()
+        
+        future = loop.create_future()
+        await self._queue.put((method, params, future))
+        
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+        
+        return await future
+    
+    async def close(self) -> None:
+        """Stop the batching worker, failing queued calls and finishing in-flight batches."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        
+        # Calls still queued will never be flushed, so release their callers
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(CongressAPIError("API call batcher closed"))
+        
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+    
+    async def _run(self) -> None:
+        """Collect queued calls into batches and flush them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            
+            try:
+                # A lone call has nothing to coalesce with, so it is sent at once;
+                # the interval is only waited out once a burst is arriving
+                while len(batch) < self.max_batch and (len(batch) > 1 or not self._queue.empty()):
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Closed mid-collection: the calls already taken off the queue
+                # would otherwise never be answered
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(CongressAPIError("API call batcher closed"))
+                raise
+            
+            # Flush in the background so the next batch can start collecting
+            task = asyncio.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+    
+    async def _flush(self, batch: List[Tuple[str, Dict[str, Any], asyncio.Future]]) -> None:
+        """Issue one request per distinct call in the batch and resolve its futures."""
+        groups: Dict[Tuple[str, Tuple], List[asyncio.Future]] = {}
+        calls: Dict[Tuple[str, Tuple], Tuple[str, Dict[str, Any]]] = {}
+        
+        for method, params, future in batch:
+            try:
+                key = (method, tuple(sorted(params.items())))
+                group = groups.get(key)
+            except TypeError as e:
+                # Unhashable params cannot be grouped; fail this call alone
+                if not future.done():
+                    future.set_exception(CongressAPIError(f"Cannot batch {method} call: {e}"))
+                continue
+            if group is None:
+                group = groups[key] = []
+                calls[key] = (method, params)
+            group.append(future)
+        
+        if len(groups) < len(batch):
+            logger.debug(f"Coalesced {len(batch)} API calls into {len(groups)} requests")
+        
+        results = await asyncio.gather(
+            *(getattr(self.client, method)(**params) for method, params in calls.values()),
+            return_exceptions=True
+        )
+        
+        for key, result in zip(calls, results):
+            for future in groups[key]:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlencode
 
 import httpx
+import orjson
 from pydantic import BaseModel, Field
 
 from ..utils.config import settings
@@ -86,8 +87,9 @@ class CongressAPIClient:
         endpoint: str,
         cache_type: str = "default",
         use_cache: bool = True,
+        raw: bool = False,
         **params
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], bytes, str]:
         """
         Make an API request with rate limiting and caching.
         
@@ -95,6 +97,8 @@ class CongressAPIClient:
             endpoint: API endpoint path
             cache_type: Cache category for TTL calculation
             use_cache: Whether to use caching
+            raw: Return the undecoded JSON body (bytes, or str from cache) for
+                parsing straight into a model with parse_list
             **params: Query parameters
             
         Returns:
@@ -104,10 +108,13 @@ class CongressAPIClient:
             CongressAPIError: If request fails
         """
         
+        # Raw bodies are cached separately from decoded responses
+        cache_params = dict(params, raw=True) if raw else params
+        
         # Check cache first
         if use_cache:
             cached_response = await cache_manager.get(
-                cache_type, endpoint, **params
+                cache_type, endpoint, **cache_params
             )
             if cached_response:
                 logger.debug(f"Cache hit for {endpoint}")
@@ -127,11 +134,15 @@ class CongressAPIClient:
             response = await session.get(url)
             response.raise_for_status()
             
-            data = response.json()
+            if raw:
+                data = response.content
+                cached_value = response.text  # Text survives JSON-serializing cache backends
+            else:
+                data = cached_value = orjson.loads(response.content)
             
             # Cache successful response
             if use_cache:
-                await cache_manager.set(cache_type, data, endpoint, **params)
+                await cache_manager.set(cache_type, cached_value, endpoint, **cache_params)
             
             logger.debug(f"Request successful for {endpoint}")
             return data
@@ -155,8 +166,9 @@ class CongressAPIClient:
         congress: Optional[int] = None,
         chamber: Optional[str] = None,
         limit: int = 250,
-        offset: int = 0
-    ) -> Dict[str, Any]:
+        offset: int = 0,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], bytes, str]:
         """
         Get committees information.
         
@@ -165,6 +177,7 @@ class CongressAPIClient:
             chamber: Chamber (house, senate, joint)
             limit: Number of results to return
             offset: Starting offset
+            raw: Return the undecoded JSON body for parse_list
             
         Returns:
             Committee data
@@ -177,7 +190,7 @@ class CongressAPIClient:
             "offset": offset
         }
         
-        return await self._make_request(endpoint, "committee", **params)
+        return await self._make_request(endpoint, "committee", raw=raw, **params)
     
     async def get_committee_meetings(
         self,
@@ -217,8 +230,9 @@ class CongressAPIClient:
         chamber: Optional[str] = None,
         committee: Optional[str] = None,
         limit: int = 250,
-        offset: int = 0
-    ) -> Dict[str, Any]:
+        offset: int = 0,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], bytes, str]:
         """
         Get committee hearings information.
         
@@ -228,6 +242,7 @@ class CongressAPIClient:
             committee: Committee code
             limit: Number of results to return
             offset: Starting offset
+            raw: Return the undecoded JSON body for parse_list
             
         Returns:
             Hearing data
@@ -241,7 +256,7 @@ class CongressAPIClient:
             "offset": offset
         }
         
-        return await self._make_request(endpoint, "hearing", **params)
+        return await self._make_request(endpoint, "hearing", raw=raw, **params)
     
     # Bill Methods
     
@@ -250,8 +265,9 @@ class CongressAPIClient:
         congress: Optional[int] = None,
         bill_type: Optional[str] = None,
         limit: int = 250,
-        offset: int = 0
-    ) -> Dict[str, Any]:
+        offset: int = 0,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], bytes, str]:
         """
         Get bills information.
         
@@ -260,6 +276,7 @@ class CongressAPIClient:
             bill_type: Bill type (hr, s, hjres, sjres, hconres, sconres, hres, sres)
             limit: Number of results to return
             offset: Starting offset
+            raw: Return the undecoded JSON body for parse_list
             
         Returns:
             Bill data
@@ -272,7 +289,7 @@ class CongressAPIClient:
             "offset": offset
         }
         
-        return await self._make_request(endpoint, "bill", **params)
+        return await self._make_request(endpoint, "bill", raw=raw, **params)
     
     async def get_bill_details(
         self,
@@ -303,8 +320,9 @@ class CongressAPIClient:
         chamber: Optional[str] = None,
         state: Optional[str] = None,
         limit: int = 250,
-        offset: int = 0
-    ) -> Dict[str, Any]:
+        offset: int = 0,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], bytes, str]:
         """
         Get members information.
         
@@ -314,6 +332,7 @@ class CongressAPIClient:
             state: State abbreviation
             limit: Number of results to return
             offset: Starting offset
+            raw: Return the undecoded JSON body for parse_list
             
         Returns:
             Member data
@@ -327,7 +346,7 @@ class CongressAPIClient:
             "offset": offset
         }
         
-        return await self._make_request(endpoint, "member", **params)
+        return await self._make_request(endpoint, "member", raw=raw, **params)
     
     # Utility Methods
     
@@ -69,7 +69,7 @@ class RateLimiter:
     async def wait_if_needed(self) -> None:
         """Wait if rate limit would be exceeded."""
         async with self._lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             
             # Check all windows
             max_wait_time = 0.0
@@ -84,7 +84,7 @@ class RateLimiter:
             
             if max_wait_time > 0:
                 await asyncio.sleep(max_wait_time)
-                current_time = time.time()
+                current_time = time.monotonic()
             
             # Record the request
             for window in self.windows.values():
@@ -93,7 +93,7 @@ class RateLimiter:
     async def can_make_request(self) -> bool:
         """Check if we can make a request without waiting."""
         async with self._lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             return all(
                 window.can_make_request(current_time) 
                 for window in self.windows.values()
@@ -101,7 +101,7 @@ class RateLimiter:
     
     def get_rate_limit_status(self) -> Dict[str, Dict[str, int]]:
         """Get current rate limit status."""
-        current_time = time.time()
+        current_time = time.monotonic()
         status = {}
         
         for window_name, window in self.windows.items():
@@ -3,10 +3,11 @@ Enhanced search capabilities for Congress API Explorer.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 
+from ..models.bill import BillList
 from ..utils.logging import logger
 from .client import CongressAPIClient
 
@@ -26,13 +27,88 @@ class SearchResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Keyword expansion for search_by_topic
+_TOPIC_TERMS: Dict[str, List[str]] = {
+    "healthcare": ["health", "medicare", "medicaid", "affordable care"],
+    "economy": ["economic", "budget", "tax", "finance", "trade"],
+    "defense": ["defense", "military", "national security", "veterans"],
+    "education": ["education", "school", "student", "college"],
+    "environment": ["climate", "environment", "energy", "renewable"],
+    "immigration": ["immigration", "border", "visa", "refugee"],
+    "technology": ["technology", "cyber", "internet", "digital"],
+    "transportation": ["transportation", "infrastructure", "highway", "transit"]
+}
+
+
+@dataclass
+class BillTable:
+    """
+    Column-oriented view of a bill list for search scoring.
+    
+    Each attribute is a parallel list indexed by bill position, with the
+    searchable text lowercased once up front so scoring only scans strings.
+    """
+    
+    bill_types: List[str] = field(default_factory=list)
+    numbers: List[str] = field(default_factory=list)  # As the API sends them, not the parsed int
+    origin_chambers: List[str] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    latest_actions: List[str] = field(default_factory=list)
+    titles_lower: List[str] = field(default_factory=list)
+    latest_actions_lower: List[str] = field(default_factory=list)
+    
+    @classmethod
+    def from_bill_list(cls, bill_list: BillList) -> "BillTable":
+        """Build the columns from a parsed bill list."""
+        bills = bill_list.get_items()
+        latest_actions = [(b.latest_action.text or "") if b.latest_action else "" for b in bills]
+        titles = [b.title or "" for b in bills]
+        return cls(
+            bill_types=[b.bill_type or "" for b in bills],
+            numbers=["" if b.bill_number is None else str(b.bill_number) for b in bills],
+            origin_chambers=[b.origin_chamber or "" for b in bills],
+            titles=titles,
+            latest_actions=latest_actions,
+            titles_lower=[t.lower() for t in titles],
+            latest_actions_lower=[a.lower() for a in latest_actions]
+        )
+    
+    def score(self, query_lower: str) -> List[float]:
+        """Compute a relevance score per bill for a lowercased query."""
+        titles = self.titles_lower
+        actions = self.latest_actions_lower
+        
+        scores = [2.0 if query_lower in title else 0.0 for title in titles]
+        for i, action in enumerate(actions):
+            if query_lower in action:
+                scores[i] += 1.0
+        
+        # Add partial matches
+        for word in query_lower.split():
+            for i, title in enumerate(titles):
+                if word in title:
+                    scores[i] += 0.5
+            for i, action in enumerate(actions):
+                if word in action:
+                    scores[i] += 0.3
+        
+        return scores
+
+
 class CongressSearchEngine:
     """
     Enhanced search engine for Congress API data.
     """
     
-    def __init__(self, client: CongressAPIClient):
+    def __init__(self, client: CongressAPIClient, concurrency: int = 4):
         self.client = client
+        # Bounds concurrent upstream searches across all fan-outs
+        self._semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _bounded(self, coro):
+        """Run a search coroutine under the shared concurrency limit."""
+        async with self._semaphore:
+            return await coro
     
     async def search_all(
         self,
@@ -54,19 +130,22 @@ class CongressSearchEngine:
         if include_types is None:
             include_types = ['bill', 'hearing', 'committee', 'member']
         
+        # Trim user input once here; model fields are no longer stripped on validation
+        query = query.strip()
+        
         logger.info(f"Searching for '{query}' across types: {include_types}")
         
         # Execute searches concurrently
         tasks = []
         
         if 'bill' in include_types:
-            tasks.append(self._search_bills(query, limit // 4))
+            tasks.append(self._bounded(self._search_bills(query, limit // 4)))
         if 'hearing' in include_types:
-            tasks.append(self._search_hearings(query, limit // 4))
+            tasks.append(self._bounded(self._search_hearings(query, limit // 4)))
         if 'committee' in include_types:
-            tasks.append(self._search_committees(query, limit // 4))
+            tasks.append(self._bounded(self._search_committees(query, limit // 4)))
         if 'member' in include_types:
-            tasks.append(self._search_members(query, limit // 4))
+            tasks.append(self._bounded(self._search_members(query, limit // 4)))
         
         # Wait for all searches to complete
         results = await asyncio.gather(*tasks)
@@ -92,43 +171,25 @@ class CongressSearchEngine:
             current_congress = await self.client.get_current_congress()
             
             # Get recent bills
-            data = await self.client.get_bills(
+            raw = await self.client.get_bills(
                 congress=current_congress,
-                limit=limit * 2  # Get more to filter
+                limit=limit * 2,  # Get more to filter
+                raw=True
             )
             
-            bills = data.get("bills", [])
+            table = BillTable.from_bill_list(BillList.parse_list(raw))
             results = []
             
-            query_lower = query.lower()
-            
-            for bill in bills:
-                title = bill.get("title", "")
-                bill_type = bill.get("type", "")
-                number = bill.get("number", "")
-                latest_action = bill.get("latestAction", {}).get("text", "")
-                
-                # Calculate relevance score
-                relevance = 0.0
-                if query_lower in title.lower():
-                    relevance += 2.0
-                if query_lower in latest_action.lower():
-                    relevance += 1.0
-                
-                # Add partial matches
-                query_words = query_lower.split()
-                for word in query_words:
-                    if word in title.lower():
-                        relevance += 0.5
-                    if word in latest_action.lower():
-                        relevance += 0.3
-                
+            for i, relevance in enumerate(table.score(query.lower())):
                 if relevance > 0:
+                    bill_type = table.bill_types[i]
+                    number = table.numbers[i]
+                    latest_action = table.latest_actions[i]
                     result = SearchResult(
                         item_type="bill",
-                        title=f"{bill_type} {number}: {title}",
+                        title=f"{bill_type} {number}: {table.titles[i]}",
                         description=latest_action,
-                        chamber=bill.get("chamber", ""),
+                        chamber=table.origin_chambers[i],
                         congress=current_congress,
                         relevance_score=relevance,
                         metadata={
@@ -392,31 +453,23 @@ class CongressSearchEngine:
         Returns:
             List of search results
         """
-        # Map common topics to search terms
-        topic_mapping = {
-            "healthcare": ["health", "medicare", "medicaid", "affordable care"],
-            "economy": ["economic", "budget", "tax", "finance", "trade"],
-            "defense": ["defense", "military", "national security", "veterans"],
-            "education": ["education", "school", "student", "college"],
-            "environment": ["climate", "environment", "energy", "renewable"],
-            "immigration": ["immigration", "border", "visa", "refugee"],
-            "technology": ["technology", "cyber", "internet", "digital"],
-            "transportation": ["transportation", "infrastructure", "highway", "transit"]
-        }
-        
         # Use mapped terms or the topic itself
-        search_terms = topic_mapping.get(topic.lower(), [topic])
+        search_terms = _TOPIC_TERMS.get(topic.lower(), [topic])
         
-        # Search for each term and combine results
-        all_results = []
-        
-        for term in search_terms:
-            term_results = await self.search_all(
+        # Search all terms concurrently and combine results in term order; the
+        # per-type searches inside each search_all share the engine's semaphore
+        term_results = await asyncio.gather(*(
+            self.search_all(
                 query=term,
                 limit=limit // len(search_terms),
                 include_types=item_types
             )
-            all_results.extend(term_results)
+            for term in search_terms
+        ))
+        
+        all_results = []
+        for results in term_results:
+            all_results.extend(results)
         
         # Remove duplicates and sort by relevance
         unique_results = []
@@ -428,4 +481,4 @@ class CongressSearchEngine:
                 unique_results.append(result)
         
         unique_results.sort(key=lambda x: x.relevance_score, reverse=True)
-        return unique_results[:limit]
\ No newline at end of file
+        return unique_results[:limit]
@@ -19,12 +19,17 @@ from mcp.types import (
     Resource
 )
 
-from ..api import CongressAPIClient, CongressAPIError, CongressSearchEngine
+from ..api import CongressAPIClient, CongressAPIError, CongressSearchEngine, ToolCallBatcher
+from ..models import BillList
 from ..utils import logger, settings, health_checker
-from .tools import register_tools
+from .tools import register_tools, validate_tool_arguments
 from .resources import register_resources
 
 
+# Output entry for one bill, filled from Bill.to_summary_dict()
+_BILL_ENTRY = "• {identifier}: {title}\\n  Latest Action: {latest_action}\\n\\n"
+
+
 class CongressMCPServer:
     """Congress API MCP Server implementation."""
     
@@ -32,6 +37,7 @@ class CongressMCPServer:
         self.server = Server("congress-api-explorer")
         self.client: Optional[CongressAPIClient] = None
         self.search_engine: Optional[CongressSearchEngine] = None
+        self.batcher: Optional[ToolCallBatcher] = None
         self._setup_handlers()
     
     def _setup_handlers(self):
@@ -107,6 +113,8 @@ class CongressMCPServer:
     async def _call_tool(self, name: str, arguments: Dict[str, Any]) -> str:
         """Route tool calls to appropriate handlers."""
         
+        validate_tool_arguments(name, arguments)
+        
         # Committee tools
         if name == "get_committees":
             return await self._get_committees(**arguments)
@@ -185,6 +193,12 @@ class CongressMCPServer:
         else:
             raise ValueError(f"Unknown resource type: {resource_type}")
     
+    async def _submit(self, method: str, **params) -> Dict[str, Any]:
+        """Make a client API call through the batcher bound to the current client."""
+        if self.batcher is None or self.batcher.client is not self.client:
+            self.batcher = ToolCallBatcher(self.client)
+        return await self.batcher.submit(method, **params)
+    
     # Committee tool implementations
     
     async def _get_committees(
@@ -194,7 +208,8 @@ class CongressMCPServer:
         limit: int = 20
     ) -> str:
         """Get committees."""
-        data = await self.client.get_committees(
+        data = await self._submit(
+            "get_committees",
             congress=congress,
             chamber=chamber,
             limit=limit
@@ -226,7 +241,8 @@ class CongressMCPServer:
         limit: int = 10
     ) -> str:
         """Get committee hearings."""
-        data = await self.client.get_committee_hearings(
+        data = await self._submit(
+            "get_committee_hearings",
             congress=congress,
             chamber=chamber,
             committee=committee,
@@ -256,7 +272,8 @@ class CongressMCPServer:
         limit: int = 10
     ) -> str:
         """Get hearings."""
-        data = await self.client.get_committee_hearings(
+        data = await self._submit(
+            "get_committee_hearings",
             congress=congress,
             chamber=chamber,
             limit=limit
@@ -290,30 +307,29 @@ class CongressMCPServer:
         limit: int = 10
     ) -> str:
         """Get bills."""
-        data = await self.client.get_bills(
+        raw = await self._submit(
+            "get_bills",
             congress=congress,
             bill_type=bill_type,
-            limit=limit
+            limit=limit,
+            raw=True
         )
         
-        bills = data.get("bills", [])
+        bills = BillList.parse_list(raw).get_items()
         
         result = f"Found {len(bills)} bills:\\n\\n"
-        
-        for bill in bills:
-            bill_type = bill.get("type", "Unknown")
-            number = bill.get("number", "Unknown")
-            title = bill.get("title", "Unknown")
-            latest_action = bill.get("latestAction", {}).get("text", "Unknown")
-            
-            result += f"• {bill_type} {number}: {title}\\n"
-            result += f"  Latest Action: {latest_action}\\n\\n"
+        result += "".join(_BILL_ENTRY.format_map(bill.to_summary_dict()) for bill in bills)
         
         return result
     
     async def _get_bill_details(self, congress: int, bill_type: str, bill_number: int) -> str:
         """Get bill details."""
-        data = await self.client.get_bill_details(congress, bill_type, bill_number)
+        data = await self._submit(
+            "get_bill_details",
+            congress=congress,
+            bill_type=bill_type,
+            bill_number=bill_number
+        )
         
         bill = data.get("bill", {})
         title = bill.get("title", "Unknown")
@@ -328,9 +344,28 @@ class CongressMCPServer:
         return result
     
     async def _search_bills(self, query: str, limit: int = 10) -> str:
-        """Search bills by title/content."""
-        # This would implement search functionality
-        return f"Search results for '{query}' (search implementation needed)"
+        """Search bills by title."""
+        query = query.strip()
+        query_lower = query.lower()
+        
+        current_congress = await self.client.get_current_congress()
+        data = await self._submit("get_bills", congress=current_congress, limit=250)
+        
+        # Only bills whose raw title matches are parsed, and parsing stops at limit
+        bill_list = BillList.from_response_lazy(data)
+        matches = []
+        for bill in bill_list.iter_items(lambda raw: query_lower in (raw.get("title") or "").lower()):
+            matches.append(bill)
+            if len(matches) >= limit:
+                break
+        
+        if not matches:
+            return f"No bills found matching '{query}'"
+        
+        result = f"Found {len(matches)} bills matching '{query}':\\n\\n"
+        result += "".join(_BILL_ENTRY.format_map(bill.to_summary_dict()) for bill in matches)
+        
+        return result
     
     # Member tool implementations
     
@@ -342,7 +377,8 @@ class CongressMCPServer:
         limit: int = 10
     ) -> str:
         """Get members."""
-        data = await self.client.get_members(
+        data = await self._submit(
+            "get_members",
             congress=congress,
             chamber=chamber,
             state=state,
@@ -480,7 +516,7 @@ class CongressMCPServer:
             
             # Get system metrics
             memory = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=None)  # Since the last reading; doesn't block
             disk_usage = psutil.disk_usage('/')
             
             # Get rate limit status
@@ -550,6 +586,9 @@ class CongressMCPServer:
                 
         finally:
             # Cleanup
+            if self.batcher:
+                await self.batcher.close()
+                self.batcher = None
             if self.client:
                 await self.client.close()
                 self.client = None
@@ -2,12 +2,135 @@
 MCP tools registration for Congress API Explorer.
 """
 
-from typing import List, Dict, Any
+import re
+from typing import List, Dict, Any, Optional
+
 from mcp.types import Tool
 
 
+# String argument patterns, compiled once and shared by the schemas and the dispatcher
+_PATTERNS = {
+    name: re.compile(pattern)
+    for name, pattern in [
+        ("system_code", r"^[a-z]{2}[a-z0-9]{2}[0-9]{2}$"),
+        ("state", r"^[A-Z]{2}$"),
+        ("bioguide_id", r"^[A-Z][0-9]{6}$"),
+    ]
+}
+
+# Schema fragments shared by several tools. They are referenced, not copied, so
+# treat them as read-only.
+_CONGRESS_PROP = {
+    "type": "integer",
+    "description": "Congress number",
+    "minimum": 1
+}
+
+_CHAMBER_PROP = {
+    "type": "string",
+    "enum": ["house", "senate", "joint"],
+    "description": "Chamber type"
+}
+
+_BILL_TYPE_PROP = {
+    "type": "string",
+    "enum": ["hr", "s", "hjres", "sjres", "hconres", "sconres", "hres", "sres"],
+    "description": "Type of bill or resolution"
+}
+
+_QUERY_PROP = {
+    "type": "string",
+    "description": "Search query",
+    "minLength": 1
+}
+
+_LIMIT_PROP_10 = {
+    "type": "integer",
+    "description": "Number of results to return",
+    "minimum": 1,
+    "maximum": 250,
+    "default": 10
+}
+
+_LIMIT_PROP_20 = {**_LIMIT_PROP_10, "default": 20}
+
+_SEARCH_LIMIT_PROP_10 = {**_LIMIT_PROP_10, "maximum": 50}
+
+_SEARCH_LIMIT_PROP_20 = {**_LIMIT_PROP_20, "maximum": 50}
+
+_NO_ARGUMENTS_SCHEMA = {
+    "type": "object",
+    "properties": {},
+    "additionalProperties": False
+}
+
+_TOPIC_PROP = {
+    "type": "string",
+    "description": "Topic to search for",
+    "enum": ["healthcare", "economy", "defense", "education", "environment", "immigration", "technology", "transportation"]
+}
+
+# Allowed enum values as frozensets for O(1) membership checks at dispatch
+_CHAMBERS = frozenset(_CHAMBER_PROP["enum"])
+_MEMBER_CHAMBERS = frozenset({"house", "senate"})
+_BILL_TYPES = frozenset(_BILL_TYPE_PROP["enum"])
+_TOPICS = frozenset(_TOPIC_PROP["enum"])
+
+# Tool name -> arguments checked against _PATTERNS
+_PATTERN_ARGUMENTS = {
+    "get_committee_details": ("system_code",),
+    "get_members": ("state",),
+    "get_member_details": ("bioguide_id",),
+}
+
+# Tool name -> (argument, allowed values) pairs
+_ENUM_ARGUMENTS = {
+    "get_committees": (("chamber", _CHAMBERS),),
+    "get_committee_hearings": (("chamber", _CHAMBERS),),
+    "get_hearings": (("chamber", _CHAMBERS),),
+    "get_bills": (("bill_type", _BILL_TYPES),),
+    "get_bill_details": (("bill_type", _BILL_TYPES),),
+    "get_members": (("chamber", _MEMBER_CHAMBERS),),
+    "search_by_topic": (("topic", _TOPICS),),
+}
+
+
+def validate_tool_arguments(name: str, arguments: Dict[str, Any]) -> None:
+    """
+    Check pattern- and enum-constrained arguments before a tool is dispatched.
+    
+    Args:
+        name: Tool name
+        arguments: Tool call arguments
+        
+    Raises:
+        ValueError: If an argument does not match its pattern or allowed values
+    """
+    for arg in _PATTERN_ARGUMENTS.get(name, ()):
+        value = arguments.get(arg)
+        if value is not None and not (isinstance(value, str) and _PATTERNS[arg].match(value)):
+            raise ValueError(f"Invalid {arg} for {name}: {value!r}")
+    
+    for arg, allowed in _ENUM_ARGUMENTS.get(name, ()):
+        value = arguments.get(arg)
+        if value is not None and not (isinstance(value, str) and value in allowed):
+            raise ValueError(f"Invalid {arg} for {name}: {value!r}")
+
+
+# Tool definitions are static, so they are built on first use and reused
+_TOOLS: Optional[List[Tool]] = None
+
+
 async def register_tools() -> List[Tool]:
     """Register all available MCP tools."""
+    global _TOOLS
+    if _TOOLS is None:
+        _TOOLS = _build_tools()
+    return _TOOLS
+
+
+def _build_tools() -> List[Tool]:
+    """Build the MCP tool definitions."""
     
     tools = [
         # Committee tools
@@ -22,18 +145,8 @@ async def register_tools() -> List[Tool]:
                         "description": "Congress number (e.g., 118 for current)",
                         "minimum": 1
                     },
-                    "chamber": {
-                        "type": "string",
-                        "enum": ["house", "senate", "joint"],
-                        "description": "Chamber type"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results to return",
-                        "minimum": 1,
-                        "maximum": 250,
-                        "default": 20
-                    }
+                    "chamber": _CHAMBER_PROP,
+                    "limit": _LIMIT_PROP_20
                 },
                 "additionalProperties": False
             }
@@ -48,7 +161,7 @@ async def register_tools() -> List[Tool]:
                     "system_code": {
                         "type": "string",
                         "description": "Committee system code (e.g., 'hsif00')",
-                        "pattern": "^[a-z]{2}[a-z0-9]{2}[0-9]{2}$"
+                        "pattern": _PATTERNS["system_code"].pattern
                     }
                 },
                 "required": ["system_code"],
@@ -62,27 +175,13 @@ async def register_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "congress": {
-                        "type": "integer",
-                        "description": "Congress number",
-                        "minimum": 1
-                    },
-                    "chamber": {
-                        "type": "string",
-                        "enum": ["house", "senate", "joint"],
-                        "description": "Chamber type"
-                    },
+                    "congress": _CONGRESS_PROP,
+                    "chamber": _CHAMBER_PROP,
                     "committee": {
                         "type": "string",
                         "description": "Committee system code"
                     },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results to return",
-                        "minimum": 1,
-                        "maximum": 250,
-                        "default": 10
-                    }
+                    "limit": _LIMIT_PROP_10
                 },
                 "additionalProperties": False
             }
@@ -95,23 +194,9 @@ async def register_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "congress": {
-                        "type": "integer",
-                        "description": "Congress number",
-                        "minimum": 1
-                    },
-                    "chamber": {
-                        "type": "string",
-                        "enum": ["house", "senate", "joint"],
-                        "description": "Chamber type"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results to return",
-                        "minimum": 1,
-                        "maximum": 250,
-                        "default": 10
-                    }
+                    "congress": _CONGRESS_PROP,
+                    "chamber": _CHAMBER_PROP,
+                    "limit": _LIMIT_PROP_10
                 },
                 "additionalProperties": False
             }
@@ -123,18 +208,8 @@ async def register_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query",
-                        "minLength": 1
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results to return",
-                        "minimum": 1,
-                        "maximum": 50,
-                        "default": 10
-                    }
+                    "query": _QUERY_PROP,
+                    "limit": _SEARCH_LIMIT_PROP_10
                 },
                 "required": ["query"],
                 "additionalProperties": False
@@ -148,23 +223,9 @@ async def register_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "congress": {
-                        "type": "integer",
-                        "description": "Congress number",
-                        "minimum": 1
-                    },
-                    "bill_type": {
-                        "type": "string",
-                        "enum": ["hr", "s", "hjres", "sjres", "hconres", "sconres", "hres", "sres"],
-                        "description": "Type of bill or resolution"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results to return",
-                        "minimum": 1,
-                        "maximum": 250,
-                        "default": 10
-                    }
+                    "congress": _CONGRESS_PROP,
+                    "bill_type": _BILL_TYPE_PROP,
+                    "limit": _LIMIT_PROP_10
                 },
                 "additionalProperties": False
             }
@@ -176,16 +237,8 @@ async def register_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "congress": {
-                        "type": "integer",
-                        "description": "Congress number",
-                        "minimum": 1
-                    },
-                    "bill_type": {
-                        "type": "string",
-                        "enum": ["hr", "s", "hjres", "sjres", "hconres", "sconres", "hres", "sres"],
-                        "description": "Type of bill or resolution"
-                    },
+                    "congress": _CONGRESS_PROP,
+                    "bill_type": _BILL_TYPE_PROP,
                     "bill_number": {
                         "type": "integer",
                         "description": "Bill number",
@@ -203,18 +256,8 @@ async def register_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query",
-                        "minLength": 1
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results to return",
-                        "minimum": 1,
-                        "maximum": 50,
-                        "default": 10
-                    }
+                    "query": _QUERY_PROP,
+                    "limit": _SEARCH_LIMIT_PROP_10
                 },
                 "required": ["query"],
                 "additionalProperties": False
@@ -228,11 +271,7 @@ async def register_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "congress": {
-                        "type": "integer",
-                        "description": "Congress number",
-                        "minimum": 1
-                    },
+                    "congress": _CONGRESS_PROP,
                     "chamber": {
                         "type": "string",
                         "enum": ["house", "senate"],
@@ -241,15 +280,9 @@ async def register_tools() -> List[Tool]:
                     "state": {
                         "type": "string",
                         "description": "State abbreviation (e.g., 'CA', 'NY')",
-                        "pattern": "^[A-Z]{2}$"
+                        "pattern": _PATTERNS["state"].pattern
                     },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results to return",
-                        "minimum": 1,
-                        "maximum": 250,
-                        "default": 10
-                    }
+                    "limit": _LIMIT_PROP_10
                 },
                 "additionalProperties": False
             }
@@ -264,7 +297,7 @@ async def register_tools() -> List[Tool]:
                     "bioguide_id": {
                         "type": "string",
                         "description": "Member's bioguide ID",
-                        "pattern": "^[A-Z][0-9]{6}$"
+                        "pattern": _PATTERNS["bioguide_id"].pattern
                     }
                 },
                 "required": ["bioguide_id"],
@@ -276,21 +309,13 @@ async def register_tools() -> List[Tool]:
         Tool(
             name="get_congress_info",
             description="Get information about current Congress",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False
-            }
+            inputSchema=_NO_ARGUMENTS_SCHEMA
         ),
         
         Tool(
             name="get_rate_limit_status",
             description="Get current API rate limit status",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False
-            }
+            inputSchema=_NO_ARGUMENTS_SCHEMA
         ),
         
         # Enhanced search tools
@@ -300,18 +325,8 @@ async def register_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query",
-                        "minLength": 1
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results to return",
-                        "minimum": 1,
-                        "maximum": 50,
-                        "default": 20
-                    },
+                    "query": _QUERY_PROP,
+                    "limit": _SEARCH_LIMIT_PROP_20,
                     "include_types": {
                         "type": "array",
                         "items": {
@@ -333,11 +348,7 @@ async def register_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "topic": {
-                        "type": "string",
-                        "description": "Topic to search for",
-                        "enum": ["healthcare", "economy", "defense", "education", "environment", "immigration", "technology", "transportation"]
-                    },
+                    "topic": _TOPIC_PROP,
                     "item_types": {
                         "type": "array",
                         "items": {
@@ -347,13 +358,7 @@ async def register_tools() -> List[Tool]:
                         "description": "Types to include in search",
                         "default": ["bill", "hearing"]
                     },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results to return",
-                        "minimum": 1,
-                        "maximum": 50,
-                        "default": 20
-                    }
+                    "limit": _SEARCH_LIMIT_PROP_20
                 },
                 "required": ["topic"],
                 "additionalProperties": False
@@ -380,11 +385,7 @@ async def register_tools() -> List[Tool]:
         Tool(
             name="get_system_metrics",
             description="Get system performance metrics and uptime",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False
-            }
+            inputSchema=_NO_ARGUMENTS_SCHEMA
         )
     ]
     
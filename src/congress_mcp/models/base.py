@@ -2,22 +2,212 @@
 Base models for Congress API data structures.
 """
 
+import sys
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional, Any, Dict, List
-from pydantic import BaseModel, Field, ConfigDict
+from functools import cached_property, lru_cache
+from typing import Optional, Any, Dict, List, Tuple, Union
+from pydantic import (
+    BaseModel,
+    Field,
+    ConfigDict,
+    GetCoreSchemaHandler,
+    GetJsonSchemaHandler,
+    TypeAdapter,
+    field_validator
+)
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema, core_schema
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+
+# Configuration shared by every model and leaf record
+_CONGRESS_CONFIG = ConfigDict(
+    extra="ignore",  # Drop unknown API fields instead of storing them per instance
+    populate_by_name=True,  # Accept field names as well as the API's aliases
+    validate_default=False,  # Defaults are None or empty lists; nothing to validate
+    revalidate_instances="never"  # Nested instances are trusted as already built
+)
+
+# Low-cardinality code fields; their values are interned so that the rows of a
+# list response share one string object per distinct value
+_INTERNED_FIELDS = (
+    "chamber",
+    "party",
+    "state",
+    "state_code",
+    "party_code",
+    "committee_type_code",
+    "bill_type"
+)
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string value; anything else is returned unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def null_as_empty_list(value: Any) -> Any:
+    """Read an explicit JSON null as an empty list; for list fields defaulting to []."""
+    return [] if value is None else value
 
 
 class BaseCongressModel(BaseModel):
     """Base model for all Congress API data structures."""
     
-    model_config = ConfigDict(
-        extra="allow",  # Allow extra fields for API evolution
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        arbitrary_types_allowed=True
+    model_config = ConfigDict(_CONGRESS_CONFIG, frozen=True)
+    
+    @field_validator(*_INTERNED_FIELDS, mode="before", check_fields=False)
+    @classmethod
+    def intern_code_fields(cls, value: Any) -> Any:
+        """Intern low-cardinality code values on validation."""
+        return _intern(value)
+    
+    @classmethod
+    def parse_list(cls, raw: Union[bytes, str]) -> "BaseCongressModel":
+        """
+        Parse a raw JSON response body straight into this model.
+        
+        Decoding and validation happen in a single pydantic-core pass over the
+        bytes, with no intermediate dict; for list responses this is faster
+        than decoding first and building the models from Python objects.
+        
+        Args:
+            raw: JSON body as returned by the client with raw=True
+            
+        Returns:
+            Validated model instance
+        """
+        return cls.model_validate_json(raw)
+
+
+def congress_dataclass(cls: type) -> type:
+    """
+    Declare a leaf record as a slotted, frozen pydantic dataclass.
+    
+    Used for small records allocated in bulk inside list responses, where
+    dropping the per-instance __dict__ of a BaseModel noticeably shrinks
+    memory. Aliases are declared with Field(alias=...) as on models.
+    
+    Schema building is deferred: these records are validated as part of the
+    models that contain them, so their own validator is only built if one is
+    ever instantiated directly.
+    """
+    # Leaf records get the same interning validator as the models
+    cls.intern_code_fields = field_validator(
+        *_INTERNED_FIELDS, mode="before", check_fields=False
+    )(_intern)
+    return pydantic_dataclass(
+        cls,
+        config=ConfigDict(_CONGRESS_CONFIG, defer_build=True),
+        slots=True,
+        frozen=True
     )
 
 
+@lru_cache(maxsize=None)
+def _record_keys(cls: type) -> Tuple[Tuple[str, str], ...]:
+    """(field name, API key) pairs of a reference record type; the key is the field's alias if it has one."""
+    return tuple((f.name, f.metadata.get("alias", f.name)) for f in fields(cls))
+
+
+class ReferenceRecord:
+    """
+    Base for tiny reference records kept as plain slotted dataclasses.
+    
+    Subclasses are declared with @dataclass(slots=True, frozen=True); API keys
+    that differ from the field name are given as field(metadata={"alias": ...}).
+    Pydantic builds no field schema for them: models containing one build it
+    with from_dict and serialize it field by field, honouring by_alias.
+    """
+    
+    __slots__ = ()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReferenceRecord":
+        """Build the record from a Congress API mapping; field names are accepted as well as API keys."""
+        values = {}
+        for name, key in _record_keys(cls):
+            if key in data:
+                values[name] = data[key]
+            elif name in data:
+                values[name] = data[name]
+        return cls(**values)
+    
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._coerce,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                _serialize_record, info_arg=True
+            )
+        )
+    
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        return {"title": cls.__name__, "type": "object"}
+    
+    @classmethod
+    def _coerce(cls, value: Any) -> "ReferenceRecord":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls.from_dict(value)
+        raise ValueError(f"{cls.__name__} expects a mapping")
+
+
+def _serialize_record(record: ReferenceRecord, info: core_schema.SerializationInfo) -> Dict[str, Any]:
+    """Dump a reference record keyed by API keys under by_alias, else by field names."""
+    if info.by_alias:
+        return {key: getattr(record, name) for name, key in _record_keys(type(record))}
+    return {name: getattr(record, name) for name, _ in _record_keys(type(record))}
+
+
+@dataclass(slots=True, frozen=True)
+class CountReference(ReferenceRecord):
+    """Reference to a related collection: its URL and item count."""
+    
+    url: Optional[str] = None
+    count: Optional[int] = None
+
+
+_CHAMBER_MAP = {
+    "house": "House",
+    "senate": "Senate",
+    "joint": "Joint"
+}
+
+
+class ChamberDisplayMixin:
+    """
+    Shared get_chamber_display for models with a chamber field.
+    
+    The field read is named by ``_chamber_field``; models whose chamber is
+    held elsewhere override it with a ClassVar.
+    """
+    
+    __slots__ = ()
+    
+    _chamber_field = "chamber"
+    
+    def get_chamber_display(self) -> str:
+        """Get display name for chamber."""
+        chamber = getattr(self, self._chamber_field)
+        return _CHAMBER_MAP.get(chamber.lower(), chamber) if chamber else "Unknown"
+
+
+class BillIdentifierMixin:
+    """Shared get_bill_identifier for models with ``bill_type`` and ``bill_number`` fields."""
+    
+    __slots__ = ()
+    
+    def get_bill_identifier(self) -> str:
+        """Get bill identifier string."""
+        if self.bill_type and self.bill_number:
+            return f"{self.bill_type} {self.bill_number}"
+        return "Unknown"
+
+
 class RequestInfo(BaseCongressModel):
     """Information about the API request."""
     
@@ -46,6 +236,30 @@ class ApiResponse(BaseCongressModel):
     def get_total_count(self) -> int:
         """Get total count from pagination."""
         return self.pagination.count if self.pagination else 0
+    
+    @classmethod
+    def _from_items(
+        cls,
+        data: Dict[str, Any],
+        field: str,
+        adapter: TypeAdapter
+    ) -> "ApiResponse":
+        """
+        Build a list response from raw API data.
+        
+        Items are validated in one pass through the prebuilt list adapter and
+        request/pagination info is validated on its own; the response wrapper
+        itself is not re-validated.
+        """
+        raw_items = data.get(field, [])
+        request = data.get("request")
+        pagination = data.get("pagination")
+        items = adapter.validate_python(raw_items)
+        request = RequestInfo.model_validate(request) if request else None
+        pagination = PaginationInfo.model_validate(pagination) if pagination else None
+        
+        # Sub-models are passed as built instances, so nothing is revalidated
+        return cls.model_construct(request=request, pagination=pagination, **{field: items})
 
 
 class CongressReference(BaseCongressModel):
@@ -83,10 +297,28 @@ class DateInfo(BaseCongressModel):
     time: Optional[str] = Field(None, description="Time information")
     
     
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+
 class UpdateInfo(BaseCongressModel):
     """Update information."""
     
-    update_date: Optional[datetime] = Field(None, alias="updateDate")
+    # Kept as the API's ISO 8601 string, which already sorts and displays correctly
+    update_date: Optional[str] = Field(None, alias="updateDate")
+    
+    @cached_property
+    def update_dt(self) -> Optional[datetime]:
+        """Get the update date parsed as a datetime, parsing it on first access."""
+        if self.update_date is None:
+            return None
+        return _DATETIME_ADAPTER.validate_python(self.update_date)
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "UpdateInfo":
+        """Copy the model; with ``update``, update_dt is parsed again from the new date."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("update_dt", None)
+        return copied
     
     
 class ActionInfo(BaseCongressModel):
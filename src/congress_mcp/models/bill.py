@@ -2,12 +2,15 @@
 Bill models for Congress API data structures.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import Field
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional
+from pydantic import Field, PrivateAttr, TypeAdapter
 
 from .base import (
     BaseCongressModel, 
     ApiResponse, 
+    congress_dataclass,
+    BillIdentifierMixin,
+    ChamberDisplayMixin,
     UrlReference,
     SystemCodeReference,
     LatestAction,
@@ -15,7 +18,8 @@ from .base import (
 )
 
 
-class BillSponsor(BaseCongressModel):
+@congress_dataclass
+class BillSponsor:
     """Bill sponsor information."""
     
     bioguide_id: Optional[str] = Field(None, alias="bioguideId")
@@ -30,7 +34,8 @@ class BillSponsor(BaseCongressModel):
     url: Optional[str] = None
 
 
-class BillCosponsor(BaseCongressModel):
+@congress_dataclass
+class BillCosponsor:
     """Bill cosponsor information."""
     
     bioguide_id: Optional[str] = Field(None, alias="bioguideId")
@@ -47,7 +52,8 @@ class BillCosponsor(BaseCongressModel):
     url: Optional[str] = None
 
 
-class BillCommittee(BaseCongressModel):
+@congress_dataclass
+class BillCommittee:
     """Committee associated with a bill."""
     
     url: Optional[str] = None
@@ -94,7 +100,8 @@ class BillTextVersion(BaseCongressModel):
     formats: Optional[List[Dict[str, Any]]] = None
 
 
-class BillAction(BaseCongressModel):
+@congress_dataclass
+class BillAction:
     """Bill action information."""
     
     action_code: Optional[str] = Field(None, alias="actionCode")
@@ -106,7 +113,8 @@ class BillAction(BaseCongressModel):
     type: Optional[str] = None
 
 
-class BillTitle(BaseCongressModel):
+@congress_dataclass
+class BillTitle:
     """Bill title information."""
     
     bill_text_version_code: Optional[str] = Field(None, alias="billTextVersionCode")
@@ -119,9 +127,11 @@ class BillTitle(BaseCongressModel):
     update_date: Optional[str] = Field(None, alias="updateDate")
 
 
-class Bill(BaseCongressModel):
+class Bill(BillIdentifierMixin, ChamberDisplayMixin, BaseCongressModel):
     """Bill information."""
     
+    _chamber_field: ClassVar[str] = "origin_chamber"
+    
     url: Optional[str] = None
     congress: Optional[int] = None
     bill_type: Optional[str] = Field(None, alias="type")
@@ -143,46 +153,90 @@ class Bill(BaseCongressModel):
     latest_action: Optional[LatestAction] = Field(None, alias="latestAction")
     update_date: Optional[str] = Field(None, alias="updateDate")
     
-    def get_bill_identifier(self) -> str:
-        """Get bill identifier string."""
-        if self.bill_type and self.bill_number:
-            return f"{self.bill_type} {self.bill_number}"
-        return "Unknown"
+    # Display values derived once per instance; model_copy(update=...) derives them again
+    _sponsor_name: str = PrivateAttr("Unknown")
+    _cosponsor_count: int = PrivateAttr(0)
+    _committee_count: int = PrivateAttr(0)
+    _is_enacted: bool = PrivateAttr(False)
+    _latest_action_text: Optional[str] = PrivateAttr("Unknown")
+    _latest_action_date: Optional[str] = PrivateAttr("Unknown")
+    _summary: Optional[Dict[str, Any]] = PrivateAttr(None)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute values used by the display getters."""
+        if self.sponsors:
+            sponsor = self.sponsors[0]
+            self._sponsor_name = sponsor.full_name or f"{sponsor.first_name} {sponsor.last_name}"
+        else:
+            self._sponsor_name = "Unknown"
+        self._cosponsor_count = len(self.cosponsors) if self.cosponsors else 0
+        self._committee_count = len(self.committees) if self.committees else 0
+        self._is_enacted = bool(self.laws)
+        if self.latest_action:
+            self._latest_action_text = self.latest_action.text
+            self._latest_action_date = self.latest_action.action_date
+        else:
+            self._latest_action_text = self._latest_action_date = "Unknown"
+        self._summary = None
     
-    def get_chamber_display(self) -> str:
-        """Get display name for origin chamber."""
-        chamber_map = {
-            "house": "House",
-            "senate": "Senate"
-        }
-        return chamber_map.get(self.origin_chamber.lower() if self.origin_chamber else "", self.origin_chamber or "Unknown")
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "Bill":
+        """Copy the bill; with ``update``, the display values are derived from the new fields."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.model_post_init(None)
+        return copied
     
     def get_sponsor_name(self) -> str:
         """Get primary sponsor name."""
-        if self.sponsors and len(self.sponsors) > 0:
-            sponsor = self.sponsors[0]
-            return sponsor.full_name or f"{sponsor.first_name} {sponsor.last_name}"
-        return "Unknown"
+        return self._sponsor_name
     
     def get_cosponsor_count(self) -> int:
         """Get number of cosponsors."""
-        return len(self.cosponsors) if self.cosponsors else 0
+        return self._cosponsor_count
     
     def get_committee_count(self) -> int:
         """Get number of committees."""
-        return len(self.committees) if self.committees else 0
+        return self._committee_count
     
     def is_enacted(self) -> bool:
         """Check if bill is enacted into law."""
-        return bool(self.laws and len(self.laws) > 0)
+        return self._is_enacted
     
     def get_latest_action_text(self) -> str:
         """Get latest action text."""
-        return self.latest_action.text if self.latest_action else "Unknown"
+        return self._latest_action_text
     
     def get_latest_action_date(self) -> str:
         """Get latest action date."""
-        return self.latest_action.action_date if self.latest_action else "Unknown"
+        return self._latest_action_date
+    
+    def to_summary_dict(self) -> Dict[str, Any]:
+        """
+        Get all display fields for the bill in one mapping.
+        
+        Built on first call and cached on the instance, so rendering code can
+        feed it straight to ``str.format_map`` instead of calling each getter.
+        
+        Returns:
+            Dictionary of display values keyed by field name
+        """
+        summary = self._summary
+        if summary is None:
+            summary = self._summary = {
+                "identifier": self.get_bill_identifier(),
+                "title": self.title or "Unknown",
+                "chamber": self.get_chamber_display(),
+                "sponsor": self._sponsor_name,
+                "cosponsor_count": self._cosponsor_count,
+                "committee_count": self._committee_count,
+                "enacted": self._is_enacted,
+                "latest_action": self._latest_action_text,
+                "latest_action_date": self._latest_action_date,
+            }
+        return summary
+
+
+_BILL_LIST_ADAPTER = TypeAdapter(List[Bill])
 
 
 class BillList(ApiResponse):
@@ -190,9 +244,40 @@ class BillList(ApiResponse):
     
     bills: List[Bill] = Field(default_factory=list)
     
+    # Unparsed bills for lists built by from_response_lazy()
+    _raw_bills: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
+    
     def get_items(self) -> List[Bill]:
         """Get bill items."""
         return self.bills
+    
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> "BillList":
+        """Build from a raw API response, validating the items in one pass."""
+        return cls._from_items(data, "bills", _BILL_LIST_ADAPTER)
+    
+    @classmethod
+    def from_response_lazy(cls, data: Dict[str, Any]) -> "BillList":
+        """Wrap a raw API response without parsing its bills; see iter_items()."""
+        bill_list = cls._from_items({**data, "bills": []}, "bills", _BILL_LIST_ADAPTER)
+        bill_list._raw_bills = data.get("bills", [])
+        return bill_list
+    
+    def iter_items(
+        self,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> Iterator[Bill]:
+        """
+        Iterate over bills, validating raw items only as they are consumed.
+        
+        Args:
+            predicate: Optional filter applied to each raw bill dict before
+                validation, so rejected bills are never parsed
+        """
+        yield from self.bills
+        for raw_bill in self._raw_bills:
+            if predicate is None or predicate(raw_bill):
+                yield Bill.model_validate(raw_bill)
 
 
 class BillDetails(ApiResponse):
@@ -227,4 +312,12 @@ class BillAmendmentList(ApiResponse):
     
     def get_items(self) -> List[BillAmendment]:
         """Get amendment items."""
-        return self.amendments
\ No newline at end of file
+        return self.amendments
+
+
+# Make sure every response schema is complete at import so the first request
+# does not pay for schema construction; a no-op for schemas already built
+Bill.model_rebuild()
+BillList.model_rebuild()
+BillDetails.model_rebuild()
+BillAmendmentList.model_rebuild()
\ No newline at end of file
@@ -2,19 +2,26 @@
 Committee models for Congress API data structures.
 """
 
+from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
-from pydantic import Field
+from pydantic import Field, TypeAdapter, field_validator, model_validator
 
 from .base import (
     BaseCongressModel, 
     ApiResponse, 
+    congress_dataclass,
+    null_as_empty_list,
+    BillIdentifierMixin,
+    ChamberDisplayMixin,
+    CountReference,
     SystemCodeReference, 
     UrlReference,
     UpdateInfo
 )
 
 
-class CommitteeParent(BaseCongressModel):
+@congress_dataclass
+class CommitteeParent:
     """Parent committee information."""
     
     url: Optional[str] = None
@@ -22,7 +29,8 @@ class CommitteeParent(BaseCongressModel):
     name: Optional[str] = None
 
 
-class CommitteeSubcommittee(BaseCongressModel):
+@congress_dataclass
+class CommitteeSubcommittee:
     """Subcommittee information."""
     
     url: Optional[str] = None
@@ -30,7 +38,8 @@ class CommitteeSubcommittee(BaseCongressModel):
     name: Optional[str] = None
 
 
-class CommitteeHistory(BaseCongressModel):
+@congress_dataclass
+class CommitteeHistory:
     """Committee history information."""
     
     end_date: Optional[str] = Field(None, alias="endDate")
@@ -44,35 +53,27 @@ class CommitteeHistory(BaseCongressModel):
     nara_id: Optional[str] = Field(None, alias="naraId")
 
 
-class CommitteeReports(BaseCongressModel):
+@dataclass(slots=True, frozen=True)
+class CommitteeReports(CountReference):
     """Committee reports reference."""
-    
-    url: Optional[str] = None
-    count: Optional[int] = None
 
 
-class CommitteeCommunications(BaseCongressModel):
+@dataclass(slots=True, frozen=True)
+class CommitteeCommunications(CountReference):
     """Committee communications reference."""
-    
-    url: Optional[str] = None
-    count: Optional[int] = None
 
 
-class CommitteeBills(BaseCongressModel):
+@dataclass(slots=True, frozen=True)
+class CommitteeBills(CountReference):
     """Committee bills reference."""
-    
-    url: Optional[str] = None
-    count: Optional[int] = None
 
 
-class CommitteeNominations(BaseCongressModel):
+@dataclass(slots=True, frozen=True)
+class CommitteeNominations(CountReference):
     """Committee nominations reference."""
-    
-    url: Optional[str] = None
-    count: Optional[int] = None
 
 
-class Committee(BaseCongressModel):
+class Committee(ChamberDisplayMixin, BaseCongressModel):
     """Committee information."""
     
     url: Optional[str] = None
@@ -81,7 +82,7 @@ class Committee(BaseCongressModel):
     chamber: Optional[str] = None
     committee_type_code: Optional[str] = Field(None, alias="committeeTypeCode")
     parent: Optional[CommitteeParent] = None
-    subcommittees: Optional[List[CommitteeSubcommittee]] = None
+    subcommittees: List[CommitteeSubcommittee] = Field(default_factory=list)
     is_current: Optional[bool] = Field(None, alias="isCurrent")
     
     # Additional fields for detailed view
@@ -90,17 +91,14 @@ class Committee(BaseCongressModel):
     communications: Optional[CommitteeCommunications] = None
     bills: Optional[CommitteeBills] = None
     nominations: Optional[CommitteeNominations] = None
-    history: Optional[List[CommitteeHistory]] = None
+    history: List[CommitteeHistory] = Field(default_factory=list)
     type: Optional[str] = None
     
-    def get_chamber_display(self) -> str:
-        """Get display name for chamber."""
-        chamber_map = {
-            "house": "House",
-            "senate": "Senate", 
-            "joint": "Joint"
-        }
-        return chamber_map.get(self.chamber.lower() if self.chamber else "", self.chamber or "Unknown")
+    @field_validator("subcommittees", "history", mode="before")
+    @classmethod
+    def null_lists_as_empty(cls, value: Any) -> Any:
+        """Treat null lists from the API as empty."""
+        return null_as_empty_list(value)
     
     def get_type_display(self) -> str:
         """Get display name for committee type."""
@@ -112,7 +110,10 @@ class Committee(BaseCongressModel):
     
     def get_subcommittee_count(self) -> int:
         """Get number of subcommittees."""
-        return len(self.subcommittees) if self.subcommittees else 0
+        return len(self.subcommittees)
+
+
+_COMMITTEE_LIST_ADAPTER = TypeAdapter(List[Committee])
 
 
 class CommitteeList(ApiResponse):
@@ -123,6 +124,11 @@ class CommitteeList(ApiResponse):
     def get_items(self) -> List[Committee]:
         """Get committee items."""
         return self.committees
+    
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> "CommitteeList":
+        """Build from a raw API response, validating the items in one pass."""
+        return cls._from_items(data, "committees", _COMMITTEE_LIST_ADAPTER)
 
 
 class CommitteeDetails(ApiResponse):
@@ -158,7 +164,7 @@ class CommitteeReportsList(ApiResponse):
         return self.reports
 
 
-class CommitteeBill(BaseCongressModel):
+class CommitteeBill(BillIdentifierMixin, BaseCongressModel):
     """Committee bill information."""
     
     congress: Optional[int] = None
@@ -167,12 +173,6 @@ class CommitteeBill(BaseCongressModel):
     relationship_type: Optional[str] = Field(None, alias="relationshipType")
     action_date: Optional[str] = Field(None, alias="actionDate")
     update_date: Optional[str] = Field(None, alias="updateDate")
-    
-    def get_bill_identifier(self) -> str:
-        """Get bill identifier string."""
-        if self.bill_type and self.bill_number:
-            return f"{self.bill_type} {self.bill_number}"
-        return "Unknown"
 
 
 class CommitteeBillsList(ApiResponse):
@@ -181,13 +181,24 @@ class CommitteeBillsList(ApiResponse):
     committee_bills: Optional[Dict[str, Any]] = Field(None, alias="committee-bills")
     bills: Optional[List[CommitteeBill]] = None
     
+    @model_validator(mode="before")
+    @classmethod
+    def flatten_committee_bills(cls, data: Any) -> Any:
+        """Lift bills out of the nested committee-bills object into bills, once."""
+        if isinstance(data, dict) and not data.get("bills"):
+            nested = data.get("committee-bills") or data.get("committee_bills") or {}
+            if isinstance(nested, dict) and isinstance(nested.get("bills"), list):
+                data = dict(data, bills=nested["bills"])
+        return data
+    
     def get_items(self) -> List[CommitteeBill]:
         """Get bill items."""
-        if self.bills:
-            return self.bills
-        elif self.committee_bills and "bills" in self.committee_bills:
-            # Handle nested structure
-            bills_data = self.committee_bills["bills"]
-            if isinstance(bills_data, list):
-                return [CommitteeBill(**bill) for bill in bills_data]
-        return []
\ No newline at end of file
+        return self.bills or []
+
+
+# Make sure every response schema is complete at import
+Committee.model_rebuild()
+CommitteeList.model_rebuild()
+CommitteeDetails.model_rebuild()
+CommitteeReportsList.model_rebuild()
+CommitteeBillsList.model_rebuild()
\ No newline at end of file
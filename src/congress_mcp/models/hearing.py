@@ -2,12 +2,17 @@
 Hearing models for Congress API data structures.
 """
 
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
-from pydantic import Field
+from pydantic import Field, TypeAdapter, field_validator
 
 from .base import (
     BaseCongressModel, 
     ApiResponse, 
+    congress_dataclass,
+    null_as_empty_list,
+    ChamberDisplayMixin,
+    ReferenceRecord,
     UrlReference,
     SystemCodeReference,
     DateInfo,
@@ -15,7 +20,8 @@ from .base import (
 )
 
 
-class HearingCommittee(BaseCongressModel):
+@congress_dataclass
+class HearingCommittee:
     """Committee associated with a hearing."""
     
     url: Optional[str] = None
@@ -23,21 +29,24 @@ class HearingCommittee(BaseCongressModel):
     name: Optional[str] = None
 
 
-class HearingJacket(BaseCongressModel):
+@dataclass(slots=True, frozen=True)
+class HearingJacket(ReferenceRecord):
     """Hearing jacket information."""
     
-    jacket_number: Optional[str] = Field(None, alias="jacketNumber")
-    jacket_id: Optional[str] = Field(None, alias="jacketId")
+    jacket_number: Optional[str] = field(default=None, metadata={"alias": "jacketNumber"})
+    jacket_id: Optional[str] = field(default=None, metadata={"alias": "jacketId"})
 
 
-class HearingFormat(BaseCongressModel):
+@dataclass(slots=True, frozen=True)
+class HearingFormat(ReferenceRecord):
     """Hearing format information."""
     
     type: Optional[str] = None
     name: Optional[str] = None
 
 
-class HearingLocation(BaseCongressModel):
+@congress_dataclass
+class HearingLocation:
     """Hearing location information."""
     
     name: Optional[str] = None
@@ -47,7 +56,8 @@ class HearingLocation(BaseCongressModel):
     zip_code: Optional[str] = Field(None, alias="zipCode")
 
 
-class HearingWitness(BaseCongressModel):
+@congress_dataclass
+class HearingWitness:
     """Hearing witness information."""
     
     name: Optional[str] = None
@@ -56,7 +66,8 @@ class HearingWitness(BaseCongressModel):
     biography: Optional[str] = None
 
 
-class HearingDocument(BaseCongressModel):
+@congress_dataclass
+class HearingDocument:
     """Hearing document information."""
     
     name: Optional[str] = None
@@ -65,14 +76,16 @@ class HearingDocument(BaseCongressModel):
     description: Optional[str] = None
 
 
-class HearingTranscript(BaseCongressModel):
+@congress_dataclass
+class HearingTranscript:
     """Hearing transcript information."""
     
     jacket_number: Optional[str] = Field(None, alias="jacketNumber")
     url: Optional[str] = None
 
 
-class HearingVideo(BaseCongressModel):
+@congress_dataclass
+class HearingVideo:
     """Hearing video information."""
     
     url: Optional[str] = None
@@ -80,7 +93,8 @@ class HearingVideo(BaseCongressModel):
     format: Optional[str] = None
 
 
-class HearingBill(BaseCongressModel):
+@congress_dataclass
+class HearingBill:
     """Bill associated with a hearing."""
     
     congress: Optional[int] = None
@@ -90,7 +104,7 @@ class HearingBill(BaseCongressModel):
     title: Optional[str] = None
 
 
-class Hearing(BaseCongressModel):
+class Hearing(ChamberDisplayMixin, BaseCongressModel):
     """Hearing information."""
     
     url: Optional[str] = None
@@ -103,21 +117,18 @@ class Hearing(BaseCongressModel):
     location: Optional[HearingLocation] = None
     committee: Optional[HearingCommittee] = None
     formats: Optional[List[HearingFormat]] = None
-    witnesses: Optional[List[HearingWitness]] = None
-    documents: Optional[List[HearingDocument]] = None
-    transcripts: Optional[List[HearingTranscript]] = None
-    videos: Optional[List[HearingVideo]] = None
-    related_bills: Optional[List[HearingBill]] = Field(None, alias="relatedBills")
+    witnesses: List[HearingWitness] = Field(default_factory=list)
+    documents: List[HearingDocument] = Field(default_factory=list)
+    transcripts: List[HearingTranscript] = Field(default_factory=list)
+    videos: List[HearingVideo] = Field(default_factory=list)
+    related_bills: List[HearingBill] = Field(default_factory=list, alias="relatedBills")
     update_date: Optional[str] = Field(None, alias="updateDate")
     
-    def get_chamber_display(self) -> str:
-        """Get display name for chamber."""
-        chamber_map = {
-            "house": "House",
-            "senate": "Senate", 
-            "joint": "Joint"
-        }
-        return chamber_map.get(self.chamber.lower() if self.chamber else "", self.chamber or "Unknown")
+    @field_validator("witnesses", "documents", "transcripts", "videos", "related_bills", mode="before")
+    @classmethod
+    def null_lists_as_empty(cls, value: Any) -> Any:
+        """Treat null lists from the API as empty."""
+        return null_as_empty_list(value)
     
     def get_committee_name(self) -> str:
         """Get committee name."""
@@ -135,19 +146,22 @@ class Hearing(BaseCongressModel):
     
     def has_video(self) -> bool:
         """Check if hearing has video."""
-        return bool(self.videos and len(self.videos) > 0)
+        return bool(self.videos)
     
     def has_transcript(self) -> bool:
         """Check if hearing has transcript."""
-        return bool(self.transcripts and len(self.transcripts) > 0)
+        return bool(self.transcripts)
     
     def get_witness_count(self) -> int:
         """Get number of witnesses."""
-        return len(self.witnesses) if self.witnesses else 0
+        return len(self.witnesses)
     
     def get_related_bills_count(self) -> int:
         """Get number of related bills."""
-        return len(self.related_bills) if self.related_bills else 0
+        return len(self.related_bills)
+
+
+_HEARING_LIST_ADAPTER = TypeAdapter(List[Hearing])
 
 
 class HearingList(ApiResponse):
@@ -158,6 +172,11 @@ class HearingList(ApiResponse):
     def get_items(self) -> List[Hearing]:
         """Get hearing items."""
         return self.hearings
+    
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> "HearingList":
+        """Build from a raw API response, validating the items in one pass."""
+        return cls._from_items(data, "hearings", _HEARING_LIST_ADAPTER)
 
 
 class HearingDetails(ApiResponse):
@@ -170,7 +189,7 @@ class HearingDetails(ApiResponse):
         return [self.hearing] if self.hearing else []
 
 
-class CommitteeMeeting(BaseCongressModel):
+class CommitteeMeeting(ChamberDisplayMixin, BaseCongressModel):
     """Committee meeting information."""
     
     url: Optional[str] = None
@@ -183,18 +202,15 @@ class CommitteeMeeting(BaseCongressModel):
     meeting_type: Optional[str] = Field(None, alias="meetingType")
     title: Optional[str] = None
     agenda: Optional[str] = None
-    hearing_transcripts: Optional[List[HearingTranscript]] = Field(None, alias="hearingTranscripts")
-    related_bills: Optional[List[HearingBill]] = Field(None, alias="relatedBills")
+    hearing_transcripts: List[HearingTranscript] = Field(default_factory=list, alias="hearingTranscripts")
+    related_bills: List[HearingBill] = Field(default_factory=list, alias="relatedBills")
     update_date: Optional[str] = Field(None, alias="updateDate")
     
-    def get_chamber_display(self) -> str:
-        """Get display name for chamber."""
-        chamber_map = {
-            "house": "House",
-            "senate": "Senate", 
-            "joint": "Joint"
-        }
-        return chamber_map.get(self.chamber.lower() if self.chamber else "", self.chamber or "Unknown")
+    @field_validator("hearing_transcripts", "related_bills", mode="before")
+    @classmethod
+    def null_lists_as_empty(cls, value: Any) -> Any:
+        """Treat null lists from the API as empty."""
+        return null_as_empty_list(value)
     
     def get_committee_name(self) -> str:
         """Get committee name."""
@@ -212,4 +228,11 @@ class CommitteeMeetingList(ApiResponse):
     
     def get_items(self) -> List[CommitteeMeeting]:
         """Get meeting items."""
-        return self.committee_meetings
\ No newline at end of file
+        return self.committee_meetings
+
+
+# Make sure every response schema is complete at import
+Hearing.model_rebuild()
+HearingList.model_rebuild()
+HearingDetails.model_rebuild()
+CommitteeMeetingList.model_rebuild()
\ No newline at end of file
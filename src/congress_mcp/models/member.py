@@ -2,19 +2,35 @@
 Member models for Congress API data structures.
 """
 
-from typing import List, Optional, Dict, Any, Union
-from pydantic import Field
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Optional, Dict, Any
+from pydantic import Field, PrivateAttr, TypeAdapter, field_validator
 
 from .base import (
     BaseCongressModel, 
     ApiResponse, 
+    congress_dataclass,
+    null_as_empty_list,
+    BillIdentifierMixin,
+    CountReference,
     UrlReference,
     UpdateInfo,
     Contact
 )
 
 
-class MemberTerm(BaseCongressModel):
+_PARTY_MAP = {
+    "D": "Democrat",
+    "R": "Republican",
+    "I": "Independent",
+    "ID": "Independent Democrat",
+    "L": "Libertarian"
+}
+
+
+@congress_dataclass
+class MemberTerm:
     """Member term information."""
     
     congress: Optional[int] = None
@@ -29,7 +45,8 @@ class MemberTerm(BaseCongressModel):
     member_type: Optional[str] = Field(None, alias="memberType")
 
 
-class MemberLeadership(BaseCongressModel):
+@congress_dataclass
+class MemberLeadership:
     """Member leadership position."""
     
     congress: Optional[int] = None
@@ -37,7 +54,8 @@ class MemberLeadership(BaseCongressModel):
     type: Optional[str] = None
     
     
-class MemberCommittee(BaseCongressModel):
+@congress_dataclass
+class MemberCommittee:
     """Member committee information."""
     
     url: Optional[str] = None
@@ -47,28 +65,26 @@ class MemberCommittee(BaseCongressModel):
     rank: Optional[int] = None
 
 
-class MemberSponsoredLegislation(BaseCongressModel):
+@dataclass(slots=True, frozen=True)
+class MemberSponsoredLegislation(CountReference):
     """Member sponsored legislation reference."""
-    
-    url: Optional[str] = None
-    count: Optional[int] = None
 
 
-class MemberCosponsoredLegislation(BaseCongressModel):
+@dataclass(slots=True, frozen=True)
+class MemberCosponsoredLegislation(CountReference):
     """Member cosponsored legislation reference."""
-    
-    url: Optional[str] = None
-    count: Optional[int] = None
 
 
-class MemberDepiction(BaseCongressModel):
+@congress_dataclass
+class MemberDepiction:
     """Member photo/image information."""
     
     attribution: Optional[str] = None
     image_url: Optional[str] = Field(None, alias="imageUrl")
 
 
-class MemberName(BaseCongressModel):
+@congress_dataclass
+class MemberName:
     """Member name information."""
     
     first_name: Optional[str] = Field(None, alias="firstName")
@@ -79,7 +95,8 @@ class MemberName(BaseCongressModel):
     official_name: Optional[str] = Field(None, alias="officialName")
 
 
-class MemberAddress(BaseCongressModel):
+@congress_dataclass
+class MemberAddress:
     """Member address information."""
     
     address1: Optional[str] = None
@@ -101,50 +118,71 @@ class Member(BaseCongressModel):
     full_name: Optional[str] = Field(None, alias="fullName")
     last_name: Optional[str] = Field(None, alias="lastName")
     middle_name: Optional[str] = Field(None, alias="middleName")
-    name: Optional[Union[str, MemberName]] = None  # Can be string or MemberName object
+    name: Optional[MemberName] = None  # Plain-string names are wrapped as official_name
     party: Optional[str] = None
     state: Optional[str] = None
     terms: Optional[Dict[str, List[MemberTerm]]] = None  # Nested under 'item' key
-    leadership: Optional[List[MemberLeadership]] = None
-    committees: Optional[List[MemberCommittee]] = None
+    leadership: List[MemberLeadership] = Field(default_factory=list)
+    committees: List[MemberCommittee] = Field(default_factory=list)
     sponsored_legislation: Optional[MemberSponsoredLegislation] = Field(None, alias="sponsoredLegislation")
     cosponsored_legislation: Optional[MemberCosponsoredLegislation] = Field(None, alias="cosponsoredLegislation")
     depiction: Optional[MemberDepiction] = None
-    addresses: Optional[List[MemberAddress]] = None
+    addresses: List[MemberAddress] = Field(default_factory=list)
     phone_number: Optional[str] = Field(None, alias="phoneNumber")
     
     # Additional biographical information
     birth_year: Optional[int] = Field(None, alias="birthYear")
     death_year: Optional[int] = Field(None, alias="deathYear")
     honorific_name: Optional[str] = Field(None, alias="honorificName")
-    nicknames: Optional[List[str]] = None
+    nicknames: List[str] = Field(default_factory=list)
     official_website_url: Optional[str] = Field(None, alias="officialWebsiteUrl")
     
     update_date: Optional[str] = Field(None, alias="updateDate")
     
+    # Derived once per instance; model_copy(update=...) derives it again
+    _display_name: str = PrivateAttr("Unknown")
+    
+    @field_validator("leadership", "committees", "addresses", "nicknames", mode="before")
+    @classmethod
+    def null_lists_as_empty(cls, value: Any) -> Any:
+        """Treat null lists from the API as empty."""
+        return null_as_empty_list(value)
+    
+    @field_validator("name", mode="before")
+    @classmethod
+    def wrap_plain_name(cls, value: Any) -> Any:
+        """Accept the API's plain-string name form as a MemberName."""
+        if isinstance(value, str):
+            return {"officialName": value}
+        return value
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the display name."""
+        name = self.name
+        if self.full_name:
+            self._display_name = self.full_name
+        elif self.first_name and self.last_name:
+            self._display_name = f"{self.first_name} {self.last_name}"
+        elif name:
+            self._display_name = name.official_name or f"{name.first_name} {name.last_name}"
+        else:
+            self._display_name = "Unknown"
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "Member":
+        """Copy the member; with ``update``, the display name and current term are derived from the new fields."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.model_post_init(None)
+            copied.__dict__.pop("current_term", None)  # Found again from the new terms
+        return copied
+    
     def get_display_name(self) -> str:
         """Get display name for member."""
-        if self.full_name:
-            return self.full_name
-        if self.first_name and self.last_name:
-            return f"{self.first_name} {self.last_name}"
-        if self.name:
-            if isinstance(self.name, str):
-                return self.name
-            else:
-                return self.name.official_name or f"{self.name.first_name} {self.name.last_name}"
-        return "Unknown"
+        return self._display_name
     
     def get_party_display(self) -> str:
         """Get party display name."""
-        party_map = {
-            "D": "Democrat",
-            "R": "Republican", 
-            "I": "Independent",
-            "ID": "Independent Democrat",
-            "L": "Libertarian"
-        }
-        return party_map.get(self.party, self.party or "Unknown")
+        return _PARTY_MAP.get(self.party, self.party or "Unknown")
     
     def get_state_display(self) -> str:
         """Get state display."""
@@ -156,8 +194,9 @@ class Member(BaseCongressModel):
             return f"District {self.district}"
         return "At Large"
     
-    def get_current_term(self) -> Optional[MemberTerm]:
-        """Get current term information."""
+    @cached_property
+    def current_term(self) -> Optional[MemberTerm]:
+        """Most recent term, found on first access and cached on the instance."""
         if not self.terms:
             return None
         
@@ -166,25 +205,40 @@ class Member(BaseCongressModel):
         if not term_list:
             return None
         
-        # Return the most recent term
-        return max(term_list, key=lambda t: t.congress or 0)
+        # Return the most recent term (the first one on ties, like max())
+        best_term = None
+        best_congress = -1
+        for term in term_list:
+            congress = term.congress or 0
+            if congress > best_congress:
+                best_congress = congress
+                best_term = term
+        return best_term
+    
+    def get_current_term(self) -> Optional[MemberTerm]:
+        """Get current term information."""
+        return self.current_term
     
     def get_current_chamber(self) -> str:
         """Get current chamber."""
-        current_term = self.get_current_term()
+        current_term = self.current_term
         if current_term:
             return current_term.chamber or "Unknown"
         return "Unknown"
     
     def get_committee_count(self) -> int:
         """Get number of committees."""
-        return len(self.committees) if self.committees else 0
+        return len(self.committees)
     
     def get_leadership_positions(self) -> List[str]:
         """Get list of leadership positions."""
-        if not self.leadership:
-            return []
-        return [pos.type for pos in self.leadership if pos.type and pos.current]
+        positions = []
+        append = positions.append
+        for pos in self.leadership:
+            position_type = pos.type
+            if position_type and pos.current:
+                append(position_type)
+        return positions
     
     def has_photo(self) -> bool:
         """Check if member has photo."""
@@ -196,13 +250,16 @@ class Member(BaseCongressModel):
     
     def is_active(self) -> bool:
         """Check if member is currently active."""
-        current_term = self.get_current_term()
+        current_term = self.current_term
         if not current_term:
             return False
         # This is a simple heuristic - in practice you'd want to check end dates
         return current_term.congress and current_term.congress >= 118  # Adjust as needed
 
 
+_MEMBER_LIST_ADAPTER = TypeAdapter(List[Member])
+
+
 class MemberList(ApiResponse):
     """Member list response."""
     
@@ -211,6 +268,11 @@ class MemberList(ApiResponse):
     def get_items(self) -> List[Member]:
         """Get member items."""
         return self.members
+    
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> "MemberList":
+        """Build from a raw API response, validating the items in one pass."""
+        return cls._from_items(data, "members", _MEMBER_LIST_ADAPTER)
 
 
 class MemberDetails(ApiResponse):
@@ -223,7 +285,7 @@ class MemberDetails(ApiResponse):
         return [self.member] if self.member else []
 
 
-class MemberSponsoredBill(BaseCongressModel):
+class MemberSponsoredBill(BillIdentifierMixin, BaseCongressModel):
     """Member sponsored bill information."""
     
     congress: Optional[int] = None
@@ -234,12 +296,6 @@ class MemberSponsoredBill(BaseCongressModel):
     introduced_date: Optional[str] = Field(None, alias="introducedDate")
     policy_area: Optional[str] = Field(None, alias="policyArea")
     latest_action: Optional[str] = Field(None, alias="latestAction")
-    
-    def get_bill_identifier(self) -> str:
-        """Get bill identifier string."""
-        if self.bill_type and self.bill_number:
-            return f"{self.bill_type} {self.bill_number}"
-        return "Unknown"
 
 
 class MemberSponsoredBillList(ApiResponse):
@@ -252,7 +308,7 @@ class MemberSponsoredBillList(ApiResponse):
         return self.sponsored_legislation
 
 
-class MemberCosponsoredBill(BaseCongressModel):
+class MemberCosponsoredBill(BillIdentifierMixin, BaseCongressModel):
     """Member cosponsored bill information."""
     
     congress: Optional[int] = None
@@ -263,12 +319,6 @@ class MemberCosponsoredBill(BaseCongressModel):
     sponsorship_date: Optional[str] = Field(None, alias="sponsorshipDate")
     policy_area: Optional[str] = Field(None, alias="policyArea")
     latest_action: Optional[str] = Field(None, alias="latestAction")
-    
-    def get_bill_identifier(self) -> str:
-        """Get bill identifier string."""
-        if self.bill_type and self.bill_number:
-            return f"{self.bill_type} {self.bill_number}"
-        return "Unknown"
 
 
 class MemberCosponsoredBillList(ApiResponse):
@@ -278,4 +328,12 @@ class MemberCosponsoredBillList(ApiResponse):
     
     def get_items(self) -> List[MemberCosponsoredBill]:
         """Get cosponsored bill items."""
-        return self.cosponsored_legislation
\ No newline at end of file
+        return self.cosponsored_legislation
+
+
+# Make sure every response schema is complete at import
+Member.model_rebuild()
+MemberList.model_rebuild()
+MemberDetails.model_rebuild()
+MemberSponsoredBillList.model_rebuild()
+MemberCosponsoredBillList.model_rebuild()
\ No newline at end of file
@@ -2,10 +2,22 @@
 Utility modules for Congress API Explorer.
 """
 
+import importlib
+from typing import Any
+
 from .config import settings, get_cache_ttl
 from .logging import logger, setup_logging
-from .cache import cache_manager, CacheManager
-from .health import health_checker, HealthChecker, HealthStatus, SystemHealth
+
+# Cache and health utilities are imported on first access (PEP 562), so callers
+# that only need settings or logging don't load them
+_LAZY_ATTRIBUTES = {
+    "cache_manager": "cache",
+    "CacheManager": "cache",
+    "health_checker": "health",
+    "HealthChecker": "health",
+    "HealthStatus": "health",
+    "SystemHealth": "health"
+}
 
 __all__ = [
     "settings",
@@ -18,4 +30,14 @@ __all__ = [
     "HealthChecker",
     "HealthStatus",
     "SystemHealth"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
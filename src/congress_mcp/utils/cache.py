@@ -2,15 +2,24 @@
 Caching utilities for Congress API Explorer.
 """
 
-import json
+import asyncio
+import heapq
+import random
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Dict, Union
-from hashlib import md5
+from typing import Any, Optional, Dict, List, Tuple, Union
+
+from xxhash import xxh3_64_hexdigest
 
 from .config import settings, get_cache_ttl
 from .logging import logger
 
+# Expiry time of entries stored without a TTL
+_NEVER = float("inf")
+
+# Entries sampled per eviction when a MemoryCache is full
+_EVICTION_SAMPLE_SIZE = 5
+
 
 class CacheBackend(ABC):
     """Abstract base class for cache backends."""
@@ -37,84 +46,167 @@ class CacheBackend(ABC):
 
 
 class MemoryCache(CacheBackend):
-    """In-memory cache implementation."""
+    """
+    In-memory cache implementation.
     
-    def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    Holds at most ``capacity`` entries. When full, an insert evicts by
+    approximate LRU: a few keys are sampled at random and an expired one, or
+    else the least recently used one, is dropped.
+    """
+    
+    def __init__(self, capacity: int = 10_000):
+        self.capacity = capacity
+        # Values, expiry and last-access times live in parallel dicts rather
+        # than one entry dict per key; the heap orders expiry times so _sweep
+        # can drop expired entries without scanning the whole cache
+        self._values: Dict[str, Any] = {}
+        self._expires: Dict[str, float] = {}
+        self._last_access: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Keys in a list (with each key's index) so eviction can sample them in O(1)
+        self._keys: List[str] = []
+        self._key_index: Dict[str, int] = {}
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value from memory cache."""
-        if key not in self._cache:
+        try:
+            value = self._values[key]
+        except KeyError:
             return None
         
-        entry = self._cache[key]
-        
         # Check if expired
-        if entry.get("expires_at") and time.time() > entry["expires_at"]:
-            del self._cache[key]
+        now = time.monotonic()
+        if now > self._expires.get(key, _NEVER):
+            self._remove(key)
             return None
         
-        logger.debug(f"Cache hit for key: {key}")
-        return entry["value"]
+        self._last_access[key] = now
+        logger.debug("Cache hit for key: %s", key)
+        return value
     
     async def set(self, key: str, value: Any, ttl: int = None) -> bool:
         """Set value in memory cache."""
         try:
-            entry = {
-                "value": value,
-                "created_at": time.time(),
-                "expires_at": time.time() + ttl if ttl else None
-            }
-            self._cache[key] = entry
-            logger.debug(f"Cache set for key: {key}, TTL: {ttl}")
+            now = time.monotonic()
+            self._sweep(now)
+            if key not in self._key_index:
+                if len(self._keys) >= self.capacity:
+                    self._evict(now)
+                self._key_index[key] = len(self._keys)
+                self._keys.append(key)
+            self._values[key] = value
+            self._last_access[key] = now
+            if ttl:
+                expires_at = now + ttl
+                self._expires[key] = expires_at
+                heapq.heappush(self._expiry_heap, (expires_at, key))
+            else:
+                self._expires.pop(key, None)
+            logger.debug("Cache set for key: %s, TTL: %s", key, ttl)
             return True
         except Exception as e:
-            logger.error(f"Failed to set cache for key {key}: {e}")
+            logger.error("Failed to set cache for key %s: %s", key, e)
             return False
     
     async def delete(self, key: str) -> bool:
         """Delete value from memory cache."""
-        if key in self._cache:
-            del self._cache[key]
-            logger.debug(f"Cache deleted for key: {key}")
+        if key in self._values:
+            self._remove(key)
+            logger.debug("Cache deleted for key: %s", key)
             return True
         return False
     
     async def clear(self) -> bool:
         """Clear all memory cache entries."""
-        self._cache.clear()
+        self._values.clear()
+        self._expires.clear()
+        self._last_access.clear()
+        self._expiry_heap.clear()
+        self._keys.clear()
+        self._key_index.clear()
         logger.info("Memory cache cleared")
         return True
+    
+    def _remove(self, key: str) -> None:
+        """Drop a key; its heap entry, if any, goes stale and is skipped by _sweep."""
+        self._values.pop(key, None)
+        self._expires.pop(key, None)
+        self._last_access.pop(key, None)
+        
+        # Swap the last key into the freed slot of the key list
+        index = self._key_index.pop(key, None)
+        if index is not None:
+            last_key = self._keys.pop()
+            if last_key != key:
+                self._keys[index] = last_key
+                self._key_index[last_key] = index
+    
+    def _evict(self, now: float) -> None:
+        """Make room for one entry: drop expired sampled keys, else the least recently used."""
+        sample = random.sample(self._keys, min(_EVICTION_SAMPLE_SIZE, len(self._keys)))
+        expired = [key for key in sample if now > self._expires.get(key, _NEVER)]
+        for key in expired or [min(sample, key=self._last_access.__getitem__)]:
+            self._remove(key)
+    
+    def _sweep(self, now: float) -> None:
+        """Evict every entry whose expiry time has passed."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            # Skip entries left behind by a re-set or delete of the key
+            if self._expires.get(key) == expires_at:
+                self._remove(key)
+        
+        # Re-setting keys leaves stale heap entries; rebuild once they dominate
+        if len(heap) > 2 * len(self._expires) + 64:
+            self._expiry_heap = [(expires_at, key) for key, expires_at in self._expires.items()]
+            heapq.heapify(self._expiry_heap)
 
 
 class RedisCache(CacheBackend):
     """Redis cache implementation."""
     
     def __init__(self):
+        import msgspec
+        
         self._redis = None
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        # Values are stored as MessagePack; anything msgspec can't encode
+        # natively is stored as its str(), as the json default=str did
+        self._enc = msgspec.msgpack.Encoder(enc_hook=str)
+        self._dec = msgspec.msgpack.Decoder()
     
     async def _init_redis(self):
-        """Initialize Redis connection."""
+        """Initialize Redis connection pool."""
         if self._initialized:
             return
         
-        try:
-            import redis.asyncio as redis
-            self._redis = redis.Redis(
-                host=settings.redis_host,
-                port=settings.redis_port,
-                db=settings.redis_db,
-                password=settings.redis_password,
-                decode_responses=True
-            )
-            # Test connection
-            await self._redis.ping()
-            self._initialized = True
-            logger.info("Redis cache initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize Redis cache: {e}")
-            raise
+        async with self._init_lock:
+            if self._initialized:
+                return
+            
+            try:
+                import redis.asyncio as redis
+                # A pool lets concurrent tool calls use separate connections
+                # instead of queueing behind one
+                pool = redis.ConnectionPool(
+                    host=settings.redis_host,
+                    port=settings.redis_port,
+                    db=settings.redis_db,
+                    password=settings.redis_password,
+                    decode_responses=False,
+                    max_connections=settings.redis_pool_size,
+                    health_check_interval=30
+                )
+                self._redis = redis.Redis(connection_pool=pool)
+                # Test connection
+                await self._redis.ping()
+                self._initialized = True
+                logger.info("Redis cache initialized (pool size %s)", settings.redis_pool_size)
+            except Exception as e:
+                logger.error("Failed to initialize Redis cache: %s", e)
+                raise
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value from Redis cache."""
@@ -122,23 +214,23 @@ class RedisCache(CacheBackend):
         try:
             value = await self._redis.get(key)
             if value:
-                logger.debug(f"Redis cache hit for key: {key}")
-                return json.loads(value)
+                logger.debug("Redis cache hit for key: %s", key)
+                return self._dec.decode(value)
             return None
         except Exception as e:
-            logger.error(f"Failed to get from Redis cache for key {key}: {e}")
+            logger.error("Failed to get from Redis cache for key %s: %s", key, e)
             return None
     
     async def set(self, key: str, value: Any, ttl: int = None) -> bool:
         """Set value in Redis cache."""
         await self._init_redis()
         try:
-            serialized_value = json.dumps(value, default=str)
+            serialized_value = self._enc.encode(value)
             await self._redis.set(key, serialized_value, ex=ttl)
-            logger.debug(f"Redis cache set for key: {key}, TTL: {ttl}")
+            logger.debug("Redis cache set for key: %s, TTL: %s", key, ttl)
             return True
         except Exception as e:
-            logger.error(f"Failed to set Redis cache for key {key}: {e}")
+            logger.error("Failed to set Redis cache for key %s: %s", key, e)
             return False
     
     async def delete(self, key: str) -> bool:
@@ -146,10 +238,10 @@ class RedisCache(CacheBackend):
         await self._init_redis()
         try:
             result = await self._redis.delete(key)
-            logger.debug(f"Redis cache deleted for key: {key}")
+            logger.debug("Redis cache deleted for key: %s", key)
             return result > 0
         except Exception as e:
-            logger.error(f"Failed to delete from Redis cache for key {key}: {e}")
+            logger.error("Failed to delete from Redis cache for key %s: %s", key, e)
             return False
     
     async def clear(self) -> bool:
@@ -160,7 +252,7 @@ class RedisCache(CacheBackend):
             logger.info("Redis cache cleared")
             return True
         except Exception as e:
-            logger.error(f"Failed to clear Redis cache: {e}")
+            logger.error("Failed to clear Redis cache: %s", e)
             return False
 
 
@@ -168,51 +260,43 @@ class CacheManager:
     """Cache manager that handles different cache backends."""
     
     def __init__(self):
-        self._backend: Optional[CacheBackend] = None
-    
-    def _get_backend(self) -> CacheBackend:
-        """Get or create cache backend."""
-        if self._backend is None:
-            if settings.cache_type.lower() == "redis":
-                self._backend = RedisCache()
-            else:
-                self._backend = MemoryCache()
-        return self._backend
+        # Settings are fixed by now, so the backend is chosen once up front;
+        # RedisCache only connects on first use
+        if settings.cache_type.lower() == "redis":
+            self._backend: CacheBackend = RedisCache()
+        else:
+            self._backend = MemoryCache(capacity=settings.cache_max_entries)
     
     def _make_key(self, *args, **kwargs) -> str:
         """Create cache key from arguments."""
-        key_parts = []
-        for arg in args:
-            key_parts.append(str(arg))
-        for k, v in sorted(kwargs.items()):
-            key_parts.append(f"{k}={v}")
-        
-        key_string = "|".join(key_parts)
-        return md5(key_string.encode()).hexdigest()
+        # Keys only need to be well distributed, not cryptographically strong
+        if not kwargs and len(args) == 2:
+            # Parameterless requests (cache type plus endpoint, as for bill
+            # details) skip the list; the hashed string is the one built below
+            return xxh3_64_hexdigest(f"{args[0]}|{args[1]}".encode())
+        key_parts = [str(arg) for arg in args]
+        key_parts.extend(f"{k}={kwargs[k]}" for k in sorted(kwargs))
+        return xxh3_64_hexdigest("|".join(key_parts).encode())
     
     async def get(self, cache_type: str, *args, **kwargs) -> Optional[Any]:
         """Get cached value."""
         key = self._make_key(cache_type, *args, **kwargs)
-        backend = self._get_backend()
-        return await backend.get(key)
+        return await self._backend.get(key)
     
     async def set(self, cache_type: str, value: Any, *args, **kwargs) -> bool:
         """Set cached value."""
         key = self._make_key(cache_type, *args, **kwargs)
         ttl = get_cache_ttl(cache_type)
-        backend = self._get_backend()
-        return await backend.set(key, value, ttl)
+        return await self._backend.set(key, value, ttl)
     
     async def delete(self, cache_type: str, *args, **kwargs) -> bool:
         """Delete cached value."""
         key = self._make_key(cache_type, *args, **kwargs)
-        backend = self._get_backend()
-        return await backend.delete(key)
+        return await self._backend.delete(key)
     
     async def clear(self) -> bool:
         """Clear all cached values."""
-        backend = self._get_backend()
-        return await backend.clear()
+        return await self._backend.clear()
 
 
 # Global cache manager instance
@@ -25,12 +25,14 @@ class Settings(BaseSettings):
     cache_ttl_hearing: int = Field(default=21600, env="CACHE_TTL_HEARING")
     cache_ttl_bill: int = Field(default=7200, env="CACHE_TTL_BILL")
     cache_ttl_member: int = Field(default=604800, env="CACHE_TTL_MEMBER")
+    cache_max_entries: int = Field(default=10000, ge=1, env="CACHE_MAX_ENTRIES")
     
     # Redis Configuration
     redis_host: str = Field(default="localhost", env="REDIS_HOST")
     redis_port: int = Field(default=6379, env="REDIS_PORT")
     redis_db: int = Field(default=0, env="REDIS_DB")
     redis_password: Optional[str] = Field(default=None, env="REDIS_PASSWORD")
+    redis_pool_size: int = Field(default=32, env="REDIS_POOL_SIZE")
     
     # Logging Configuration
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
@@ -50,18 +52,24 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
+        # Read once at startup; values are snapshotted at import (e.g. the TTL
+        # map below), so they must not change afterwards
+        frozen = True
 
 
 # Global settings instance
 settings = Settings()
 
+# TTLs by data type, read from settings once at import
+_TTL_MAP = {
+    "committee": settings.cache_ttl_committee,
+    "hearing": settings.cache_ttl_hearing,
+    "bill": settings.cache_ttl_bill,
+    "member": settings.cache_ttl_member,
+}
+_TTL_DEFAULT = settings.cache_ttl_default
+
 
 def get_cache_ttl(cache_type: str) -> int:
     """Get appropriate cache TTL based on data type."""
-    ttl_map = {
-        "committee": settings.cache_ttl_committee,
-        "hearing": settings.cache_ttl_hearing,
-        "bill": settings.cache_ttl_bill,
-        "member": settings.cache_ttl_member,
-    }
-    return ttl_map.get(cache_type, settings.cache_ttl_default)
\ No newline at end of file
+    return _TTL_MAP.get(cache_type, _TTL_DEFAULT)
\ No newline at end of file
@@ -5,10 +5,11 @@ Health check utilities for Congress API Explorer.
 import asyncio
 import time
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 
+import msgspec
+
 from .logging import logger
 from .config import settings
 
@@ -21,45 +22,30 @@ class HealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
-class HealthCheck:
+class HealthCheck(msgspec.Struct):
     """Individual health check result."""
     
     name: str
     status: HealthStatus
     message: str = ""
     response_time_ms: Optional[float] = None
-    timestamp: datetime = field(default_factory=datetime.now)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: datetime = msgspec.field(default_factory=datetime.now)
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
 
 
-@dataclass
-class SystemHealth:
+class SystemHealth(msgspec.Struct):
     """Overall system health status."""
     
     status: HealthStatus
-    checks: List[HealthCheck] = field(default_factory=list)
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = msgspec.field(default_factory=datetime.now)
     uptime_seconds: float = 0.0
+    checks: List[HealthCheck] = msgspec.field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "status": self.status.value,
-            "timestamp": self.timestamp.isoformat(),
-            "uptime_seconds": self.uptime_seconds,
-            "checks": [
-                {
-                    "name": check.name,
-                    "status": check.status.value,
-                    "message": check.message,
-                    "response_time_ms": check.response_time_ms,
-                    "timestamp": check.timestamp.isoformat(),
-                    "metadata": check.metadata
-                }
-                for check in self.checks
-            ]
-        }
+        # Statuses become their values and timestamps ISO strings, as msgspec
+        # encodes enums and datetimes natively
+        return msgspec.to_builtins(self, enc_hook=str)
 
 
 class HealthChecker:
@@ -69,10 +55,18 @@ class HealthChecker:
     
     def __init__(self):
         self.settings = settings
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self._cached_health: Optional[SystemHealth] = None
-        self._cache_expiry: Optional[datetime] = None
-        self._cache_duration = timedelta(seconds=30)  # Cache for 30 seconds
+        self._cache_expiry: Optional[float] = None  # time.monotonic() deadline
+        self._cache_duration = 30.0  # Cache for 30 seconds
+        
+        # Seed psutil's CPU baseline so the first health check gets a real
+        # reading from the non-blocking cpu_percent(interval=None)
+        try:
+            import psutil
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            pass
     
     async def check_health(self, force_refresh: bool = False) -> SystemHealth:
         """
@@ -86,33 +80,42 @@ class HealthChecker:
         """
         # Return cached result if available and not expired
         if not force_refresh and self._cached_health and self._cache_expiry:
-            if datetime.now() < self._cache_expiry:
+            if time.monotonic() < self._cache_expiry:
                 return self._cached_health
         
         logger.info("Performing health check...")
         
-        checks = []
-        
-        # Check 1: Basic system health
-        checks.append(await self._check_system_health())
-        
-        # Check 2: Configuration health
-        checks.append(await self._check_configuration_health())
-        
-        # Check 3: API connectivity
-        checks.append(await self._check_api_connectivity())
-        
-        # Check 4: Rate limiting status
-        checks.append(await self._check_rate_limiting())
+        # The checks are independent, so run them concurrently; the API and
+        # cache round-trips then overlap instead of adding up
+        check_names = ["system", "configuration", "api_connectivity", "rate_limiting", "cache"]
+        results = await asyncio.gather(
+            self._check_system_health(),
+            self._check_configuration_health(),
+            self._check_api_connectivity(),
+            self._check_rate_limiting(),
+            self._check_cache_health(),
+            return_exceptions=True
+        )
         
-        # Check 5: Cache health
-        checks.append(await self._check_cache_health())
+        checks = []
+        for name, result in zip(check_names, results):
+            if isinstance(result, BaseException):
+                # A cancelled check means the health check itself is being cancelled
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                result = HealthCheck(
+                    name=name,
+                    status=HealthStatus.UNKNOWN,
+                    message=f"Health check failed: {str(result)}",
+                    metadata={"error": str(result)}
+                )
+            checks.append(result)
         
         # Determine overall status
         overall_status = self._determine_overall_status(checks)
         
         # Calculate uptime
-        uptime = time.time() - self.start_time
+        uptime = time.monotonic() - self.start_time
         
         # Create health object
         health = SystemHealth(
@@ -123,24 +126,25 @@ class HealthChecker:
         
         # Cache the result
         self._cached_health = health
-        self._cache_expiry = datetime.now() + self._cache_duration
+        self._cache_expiry = time.monotonic() + self._cache_duration
         
-        logger.info(f"Health check completed. Overall status: {overall_status.value}")
+        logger.info("Health check completed. Overall status: %s", overall_status.value)
         return health
     
     async def _check_system_health(self) -> HealthCheck:
         """Check basic system health."""
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             
             # Basic system checks
             import psutil
             
-            # Check memory usage
+            # Check memory usage; CPU is averaged since the previous reading
+            # rather than sampled by blocking the event loop for a second
             memory = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             
             if memory.percent > 90:
                 return HealthCheck(
@@ -187,7 +191,7 @@ class HealthChecker:
     async def _check_configuration_health(self) -> HealthCheck:
         """Check configuration health."""
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             
             # Check required configuration
             issues = []
@@ -198,7 +202,7 @@ class HealthChecker:
             if not self.settings.congress_api_base_url:
                 issues.append("Congress API base URL not configured")
             
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             
             if issues:
                 return HealthCheck(
@@ -227,7 +231,7 @@ class HealthChecker:
     async def _check_api_connectivity(self) -> HealthCheck:
         """Check Congress API connectivity."""
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             
             # Import here to avoid circular imports
             from ..api import CongressAPIClient
@@ -239,7 +243,7 @@ class HealthChecker:
                 # Test basic API connectivity
                 current_congress = await client.get_current_congress()
                 
-                response_time = (time.time() - start_time) * 1000
+                response_time = (time.monotonic() - start_time) * 1000
                 
                 if response_time > 5000:  # 5 seconds
                     status = HealthStatus.DEGRADED
@@ -260,7 +264,7 @@ class HealthChecker:
                 await client.close()
                 
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             return HealthCheck(
                 name="api_connectivity",
                 status=HealthStatus.UNHEALTHY,
@@ -272,26 +276,26 @@ class HealthChecker:
     async def _check_rate_limiting(self) -> HealthCheck:
         """Check rate limiting status."""
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             
             # Import here to avoid circular imports
             from ..api import rate_limiter
             
             status_info = rate_limiter.get_rate_limit_status()
             
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             
             # Check if we're close to rate limits
             warnings = []
+            critical = False
             for window, info in status_info.items():
                 usage_percent = (info['used'] / info['limit']) * 100
-                if usage_percent > 90:
-                    warnings.append(f"{window} window at {usage_percent:.1f}%")
-                elif usage_percent > 70:
+                if usage_percent > 70:
                     warnings.append(f"{window} window at {usage_percent:.1f}%")
+                    critical = critical or usage_percent > 90
             
             if warnings:
-                if any("90" in w for w in warnings):
+                if critical:
                     status = HealthStatus.UNHEALTHY
                     message = f"Rate limit critical: {', '.join(warnings)}"
                 else:
@@ -320,7 +324,7 @@ class HealthChecker:
     async def _check_cache_health(self) -> HealthCheck:
         """Check cache health."""
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             
             # Import here to avoid circular imports
             from ..utils.cache import cache_manager
@@ -338,7 +342,7 @@ class HealthChecker:
             # Test delete
             await cache_manager.delete(test_key)
             
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             
             if cached_value is None:
                 return HealthCheck(
@@ -386,7 +390,7 @@ class HealthChecker:
     
     def get_uptime(self) -> float:
         """Get system uptime in seconds."""
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
     
     def get_uptime_formatted(self) -> str:
         """Get formatted uptime string."""
@@ -2,12 +2,57 @@
 Logging configuration for Congress API Explorer.
 """
 
+import atexit
 import logging
 import logging.config
+import logging.handlers
+import queue
 from typing import Optional
 
 from .config import settings
 
+_DETAILED_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s - %(message)s"
+
+# Background thread that writes queued records to the log file
+_file_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _start_file_listener(log_level: str, log_format: str) -> logging.Handler:
+    """
+    Route file logging through a queue drained by a background thread.
+    
+    The returned QueueHandler only enqueues records, so logging from async
+    code never waits on a file write; the FileHandler owned by the listener
+    opens the log file on its first record.
+    """
+    global _file_listener
+    _stop_file_listener()
+    
+    file_handler = logging.FileHandler("congress_api_explorer.log", mode="a", delay=True)
+    file_handler.setLevel(log_level)
+    file_handler.setFormatter(logging.Formatter(log_format))
+    
+    log_queue = queue.SimpleQueue()
+    _file_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _file_listener.start()
+    
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    return queue_handler
+
+
+def _stop_file_listener() -> None:
+    """Flush queued records to the log file and stop the listener thread."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
 
 def setup_logging(level: Optional[str] = None) -> logging.Logger:
     """
@@ -27,9 +72,6 @@ def setup_logging(level: Optional[str] = None) -> logging.Logger:
         "formatters": {
             "standard": {
                 "format": settings.log_format
-            },
-            "detailed": {
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s - %(message)s"
             }
         },
         "handlers": {
@@ -40,11 +82,9 @@ def setup_logging(level: Optional[str] = None) -> logging.Logger:
                 "stream": "ext://sys.stdout"
             },
             "file": {
-                "class": "logging.FileHandler",
-                "level": log_level,
-                "formatter": "detailed",
-                "filename": "congress_api_explorer.log",
-                "mode": "a"
+                "()": _start_file_listener,
+                "log_level": log_level,
+                "log_format": _DETAILED_FORMAT
             }
         },
         "loggers": {
@@ -0,0 +1,13 @@
+"""
+Shared pytest setup for Congress API Explorer tests.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Settings require an API key at import; tests never reach the real API
+os.environ.setdefault("CONGRESS_API_KEY", "test-key")
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
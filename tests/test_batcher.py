@@ -0,0 +1,110 @@
+"""
+Tests for the tool call batcher.
+"""
+
+import asyncio
+
+import pytest
+
+from congress_mcp.api import ToolCallBatcher
+from congress_mcp.api.client import CongressAPIError
+
+
+class FakeClient:
+    """Records calls and answers them after a short delay."""
+    
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls = []
+    
+    async def get_bills(self, **params):
+        self.calls.append(("get_bills", params))
+        await asyncio.sleep(self.delay)
+        return {"bills": [], "params": params}
+    
+    async def get_members(self, **params):
+        self.calls.append(("get_members", params))
+        await asyncio.sleep(self.delay)
+        raise CongressAPIError("upstream failed")
+
+
+async def test_identical_calls_share_one_request():
+    client = FakeClient()
+    batcher = ToolCallBatcher(client, flush_interval=0.02)
+    
+    results = await asyncio.gather(*(batcher.submit("get_bills", congress=118, limit=5) for _ in range(5)))
+    
+    assert client.calls == [("get_bills", {"congress": 118, "limit": 5})]
+    assert all(result == results[0] for result in results)
+    await batcher.close()
+
+
+async def test_distinct_calls_and_errors_resolve_separately():
+    client = FakeClient()
+    batcher = ToolCallBatcher(client, flush_interval=0.02)
+    
+    results = await asyncio.gather(
+        batcher.submit("get_bills", limit=5),
+        batcher.submit("get_bills", limit=10),
+        batcher.submit("get_members", limit=5),
+        return_exceptions=True
+    )
+    
+    assert len(client.calls) == 3
+    assert results[0]["params"] == {"limit": 5}
+    assert results[1]["params"] == {"limit": 10}
+    assert isinstance(results[2], CongressAPIError)
+    await batcher.close()
+
+
+async def test_close_fails_calls_still_being_collected():
+    client = FakeClient()
+    batcher = ToolCallBatcher(client, flush_interval=10)
+    
+    pending = [asyncio.create_task(batcher.submit("get_bills", limit=i)) for i in range(3)]
+    await asyncio.sleep(0.01)
+    await batcher.close()
+    
+    for task in pending:
+        with pytest.raises(CongressAPIError, match="closed"):
+            await task
+    assert client.calls == []
+
+
+async def test_close_waits_for_in_flight_flushes():
+    client = FakeClient(delay=0.05)
+    batcher = ToolCallBatcher(client, flush_interval=0.001)
+    
+    pending = asyncio.create_task(batcher.submit("get_bills", limit=1))
+    await asyncio.sleep(0.01)
+    await batcher.close()
+    
+    assert pending.done()
+    assert pending.result()["params"] == {"limit": 1}
+    assert not batcher._flushes
+
+
+async def test_lone_call_is_flushed_without_waiting():
+    client = FakeClient(delay=0)
+    batcher = ToolCallBatcher(client, flush_interval=10)
+    
+    result = await asyncio.wait_for(batcher.submit("get_bills", limit=1), 1)
+    
+    assert result["params"] == {"limit": 1}
+    await batcher.close()
+
+
+async def test_unhashable_params_fail_only_their_call():
+    client = FakeClient()
+    batcher = ToolCallBatcher(client, flush_interval=0.02)
+    
+    results = await asyncio.gather(
+        batcher.submit("get_bills", limit=5),
+        batcher.submit("get_bills", congress=[118]),
+        return_exceptions=True
+    )
+    
+    assert results[0]["params"] == {"limit": 5}
+    assert isinstance(results[1], CongressAPIError)
+    assert client.calls == [("get_bills", {"limit": 5})]
+    await batcher.close()
@@ -0,0 +1,111 @@
+"""
+Tests for the cache backends and key building.
+"""
+
+import pytest
+from xxhash import xxh3_64_hexdigest
+
+from congress_mcp.utils import cache as cache_module
+from congress_mcp.utils.cache import CacheManager, MemoryCache
+
+
+class FakeClock:
+    """Stands in for the time module so cache expiry can be stepped manually."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module, "time", fake)
+    return fake
+
+
+async def test_memory_cache_expires_entries(clock):
+    cache = MemoryCache()
+    await cache.set("short", 1, ttl=10)
+    await cache.set("forever", 2)
+    
+    clock.now += 5
+    assert await cache.get("short") == 1
+    
+    clock.now += 10
+    assert await cache.get("short") is None
+    assert await cache.get("forever") == 2
+
+
+async def test_memory_cache_sweeps_expired_entries_on_set(clock):
+    cache = MemoryCache()
+    await cache.set("a", 1, ttl=10)
+    await cache.set("b", 2, ttl=60)
+    
+    clock.now += 30
+    await cache.set("c", 3, ttl=10)
+    
+    assert "a" not in cache._values
+    assert sorted(cache._keys) == ["b", "c"]
+
+
+async def test_memory_cache_evicts_least_recently_used(clock):
+    # Capacity below the eviction sample size, so every key is sampled
+    cache = MemoryCache(capacity=3)
+    for key in ("a", "b", "c"):
+        await cache.set(key, key)
+        clock.now += 1
+    
+    await cache.get("a")
+    clock.now += 1
+    await cache.set("d", "d")
+    
+    assert await cache.get("b") is None
+    assert sorted(cache._keys) == ["a", "c", "d"]
+    assert len(cache._values) == 3
+
+
+async def test_memory_cache_evicts_expired_before_lru(clock):
+    cache = MemoryCache(capacity=2)
+    await cache.set("old", 1)
+    clock.now += 1
+    await cache.set("short", 2, ttl=5)
+    
+    # Expired, but still ahead of the sweep; eviction prefers it over the LRU key
+    clock.now += 5.5
+    cache._expiry_heap.clear()
+    await cache.set("new", 3)
+    
+    assert await cache.get("old") == 1
+    assert await cache.get("short") is None
+
+
+async def test_memory_cache_delete_keeps_key_index_consistent():
+    cache = MemoryCache()
+    for key in ("a", "b", "c"):
+        await cache.set(key, key)
+    
+    assert await cache.delete("a")
+    assert not await cache.delete("a")
+    assert {key: cache._keys[index] for key, index in cache._key_index.items()} == {"b": "b", "c": "c"}
+
+
+def test_make_key_is_stable():
+    manager = CacheManager()
+    
+    # Pinned so a change to key building, which would orphan cached entries, is noticed
+    assert manager._make_key("bill", congress=118, limit=20) == "5c76eefd237829c8"
+    assert manager._make_key("bill", congress=118, limit=20) == manager._make_key("bill", limit=20, congress=118)
+    assert manager._make_key("bill", 118) == manager._make_key("bill", "118")
+    assert manager._make_key("bill", congress=118) != manager._make_key("bill", congress=117)
+
+
+def test_make_key_parameterless_matches_general_path():
+    manager = CacheManager()
+    
+    # The parameterless shortcut must build the same key as the general path
+    assert manager._make_key("bill", "bill/118/hr/1") == xxh3_64_hexdigest(b"bill|bill/118/hr/1")
+    assert manager._make_key("bill", "bill/118/hr/1") != manager._make_key("bill", "bill/118/hr/2")
+    assert manager._make_key("bill", "bill", raw=True) != manager._make_key("bill", "bill")
@@ -0,0 +1,88 @@
+"""
+Tests for the system health checker.
+"""
+
+import asyncio
+
+import pytest
+
+from congress_mcp.utils.health import HealthCheck, HealthChecker, HealthStatus
+
+
+def healthy(name: str):
+    """Build a check coroutine function that reports a healthy result."""
+    async def check() -> HealthCheck:
+        return HealthCheck(name=name, status=HealthStatus.HEALTHY, message="ok")
+    return check
+
+
+def failing(error: BaseException):
+    """Build a check coroutine function that raises error."""
+    async def check() -> HealthCheck:
+        raise error
+    return check
+
+
+CHECKS = {
+    "_check_system_health": "system",
+    "_check_configuration_health": "configuration",
+    "_check_api_connectivity": "api_connectivity",
+    "_check_rate_limiting": "rate_limiting",
+    "_check_cache_health": "cache"
+}
+
+
+@pytest.fixture
+def checker(monkeypatch):
+    health_checker = HealthChecker()
+    for method, name in CHECKS.items():
+        monkeypatch.setattr(health_checker, method, healthy(name))
+    return health_checker
+
+
+async def test_all_checks_healthy(checker):
+    health = await checker.check_health()
+    
+    assert health.status is HealthStatus.HEALTHY
+    assert [check.name for check in health.checks] == list(CHECKS.values())
+
+
+async def test_failed_check_is_reported_as_unknown(checker, monkeypatch):
+    monkeypatch.setattr(checker, "_check_api_connectivity", failing(RuntimeError("boom")))
+    
+    health = await checker.check_health()
+    
+    check = health.checks[2]
+    assert check.name == "api_connectivity"
+    assert check.status is HealthStatus.UNKNOWN
+    assert check.message == "Health check failed: boom"
+    assert check.metadata == {"error": "boom"}
+    assert health.status is HealthStatus.UNKNOWN
+    assert all(c.status is HealthStatus.HEALTHY for c in health.checks if c is not check)
+
+
+async def test_cancelled_check_propagates(checker, monkeypatch):
+    monkeypatch.setattr(checker, "_check_cache_health", failing(asyncio.CancelledError()))
+    
+    with pytest.raises(asyncio.CancelledError):
+        await checker.check_health()
+
+
+async def test_result_is_cached_until_refresh(checker, monkeypatch):
+    first = await checker.check_health()
+    monkeypatch.setattr(checker, "_check_system_health", failing(RuntimeError("boom")))
+    
+    assert await checker.check_health() is first
+    assert (await checker.check_health(force_refresh=True)).status is HealthStatus.UNKNOWN
+
+
+@pytest.mark.parametrize("statuses, expected", [
+    ([], HealthStatus.UNKNOWN),
+    ([HealthStatus.HEALTHY, HealthStatus.DEGRADED, HealthStatus.UNKNOWN], HealthStatus.DEGRADED),
+    ([HealthStatus.DEGRADED, HealthStatus.UNHEALTHY], HealthStatus.UNHEALTHY),
+    ([HealthStatus.HEALTHY, HealthStatus.HEALTHY], HealthStatus.HEALTHY)
+])
+def test_overall_status(statuses, expected):
+    checks = [HealthCheck(name=str(i), status=status) for i, status in enumerate(statuses)]
+    
+    assert HealthChecker()._determine_overall_status(checks) is expected
@@ -0,0 +1,140 @@
+"""
+Tests for the Congress API response models.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from congress_mcp.models import Bill, BillList, Committee, CommitteeList, HearingList, Member, MemberList
+from congress_mcp.models.base import UpdateInfo
+from congress_mcp.models.member import MemberTerm
+
+SAMPLE_DIR = Path(__file__).parent.parent / "pgo-samples"
+
+LIST_MODELS = [
+    ("bills", BillList),
+    ("committees", CommitteeList),
+    ("hearings", HearingList),
+    ("members", MemberList)
+]
+
+
+def load_sample(kind: str) -> bytes:
+    """Read the recorded list response for an endpoint."""
+    return (SAMPLE_DIR / kind / "000.json").read_bytes()
+
+
+@pytest.mark.parametrize("kind, model", LIST_MODELS)
+def test_from_response_matches_model_validate(kind, model):
+    data = json.loads(load_sample(kind))
+    
+    built = model.from_response(data)
+    validated = model.model_validate(data)
+    
+    assert len(built.get_items()) == len(data[kind])
+    assert built.model_dump() == validated.model_dump()
+    assert built.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+
+
+@pytest.mark.parametrize("kind, model", LIST_MODELS)
+def test_parse_list_matches_model_validate(kind, model):
+    raw = load_sample(kind)
+    
+    assert model.parse_list(raw).model_dump() == model.model_validate(json.loads(raw)).model_dump()
+
+
+def test_from_response_without_items_or_pagination():
+    response = BillList.from_response({})
+    
+    assert response.bills == []
+    assert response.pagination is None
+    assert response.model_dump() == BillList.model_validate({}).model_dump()
+
+
+def test_null_lists_become_empty():
+    member = Member.model_validate({"bioguideId": "A000001", "leadership": None, "nicknames": None})
+    
+    assert member.leadership == []
+    assert member.nicknames == []
+    assert HearingList.from_response({"hearings": [{"title": "H", "witnesses": None}]}).hearings[0].witnesses == []
+
+
+@pytest.mark.parametrize("chamber, expected", [
+    ("House", "House"),
+    ("house", "House"),
+    ("HOUSE", "House"),
+    ("Senate", "Senate"),
+    (None, "Unknown")
+])
+def test_chamber_display(chamber, expected):
+    assert Bill(originChamber=chamber).get_chamber_display() == expected
+    assert Committee(chamber=chamber).get_chamber_display() == expected
+
+
+def test_summary_dict_matches_getters():
+    bill = Bill.model_validate({
+        "type": "HR",
+        "number": "42",
+        "originChamber": "HOUSE",
+        "title": "A bill",
+        "sponsors": [{"firstName": "Ann", "lastName": "Lee"}],
+        "cosponsors": [{"fullName": "B"}, {"fullName": "C"}],
+        "laws": [{"number": "118-1"}],
+        "latestAction": {"actionDate": "2024-01-02", "text": "Became law"}
+    })
+    
+    assert bill.to_summary_dict() == {
+        "identifier": bill.get_bill_identifier(),
+        "title": bill.title,
+        "chamber": bill.get_chamber_display(),
+        "sponsor": bill.get_sponsor_name(),
+        "cosponsor_count": bill.get_cosponsor_count(),
+        "committee_count": bill.get_committee_count(),
+        "enacted": bill.is_enacted(),
+        "latest_action": bill.get_latest_action_text(),
+        "latest_action_date": bill.get_latest_action_date()
+    }
+    assert bill.to_summary_dict()["chamber"] == "House"
+    assert Bill().to_summary_dict()["identifier"] == "Unknown"
+
+
+def test_model_copy_update_refreshes_summary():
+    bill = Bill.model_validate({"title": "Old", "sponsors": [{"fullName": "A"}], "laws": [{"number": "1"}]})
+    bill.to_summary_dict()
+    
+    copied = bill.model_copy(update={"title": "New", "sponsors": None, "laws": None})
+    
+    assert copied.to_summary_dict()["title"] == "New"
+    assert copied.get_sponsor_name() == "Unknown"
+    assert not copied.is_enacted()
+    assert bill.to_summary_dict()["title"] == "Old"
+
+
+def test_member_model_copy_update_refreshes_display_name():
+    member = Member.model_validate({"bioguideId": "A000001", "fullName": "Old Name"})
+    
+    assert member.model_copy(update={"full_name": "New Name"}).get_display_name() == "New Name"
+    assert member.model_copy(update={"full_name": None}).get_display_name() == "Unknown"
+    assert member.get_display_name() == "Old Name"
+
+
+def test_member_model_copy_update_refreshes_current_term():
+    member = Member.model_validate({"terms": {"item": [{"congress": 117}]}})
+    assert member.current_term.congress == 117
+    
+    copied = member.model_copy(update={"terms": {"item": [MemberTerm(congress=118)]}})
+    
+    assert copied.current_term.congress == 118
+    assert member.current_term.congress == 117
+
+
+def test_update_info_model_copy_update_reparses_date():
+    info = UpdateInfo(updateDate="2024-01-02T03:04:05Z")
+    assert info.update_dt.year == 2024
+    
+    copied = info.model_copy(update={"update_date": "2025-06-07T00:00:00Z"})
+    
+    assert copied.update_dt.year == 2025
+    assert info.update_dt.year == 2024
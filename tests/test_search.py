@@ -0,0 +1,141 @@
+"""
+Tests for the Congress search engine.
+"""
+
+import asyncio
+
+import orjson
+
+from congress_mcp.api.search import BillTable, CongressSearchEngine
+from congress_mcp.models import BillList
+
+
+class FakeClient:
+    """Serves fixed Congress data and tracks how many fetches overlap."""
+    
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def _fetch(self, data):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return data
+    
+    async def get_current_congress(self) -> int:
+        return 118
+    
+    async def get_bills(self, raw: bool = False, **params):
+        data = {"bills": [
+            {"type": "HR", "number": "1", "title": "Health Care Act", "originChamber": "House",
+             "latestAction": {"text": "Referred to the Subcommittee on Health"}},
+            {"type": "S", "number": "2", "title": "Medicare Tax Act", "originChamber": "Senate",
+             "latestAction": {"text": "Read twice"}},
+            {"type": "HR", "number": "3", "title": "Highway Act", "latestAction": {"text": "Passed"}}
+        ]}
+        return await self._fetch(orjson.dumps(data) if raw else data)
+    
+    async def get_committee_hearings(self, **params):
+        return await self._fetch({"hearings": [
+            {"title": "Medicaid oversight", "chamber": "Senate", "committee": {"name": "Finance"}}
+        ]})
+    
+    async def get_committees(self, **params):
+        return await self._fetch({"committees": [
+            {"name": "Health, Education, Labor, and Pensions", "chamber": "Senate", "systemCode": "sshr00"}
+        ]})
+    
+    async def get_members(self, **params):
+        return await self._fetch({"members": [{"name": "Healthy, Bob", "state": "CA", "party": "D"}]})
+
+
+async def sequential_topic_search(engine, terms, limit):
+    """The per-term search, de-duplication and ordering search_by_topic must match."""
+    all_results = []
+    for term in terms:
+        all_results.extend(await engine.search_all(query=term, limit=limit // len(terms)))
+    
+    unique_results = []
+    seen_titles = set()
+    for result in all_results:
+        if result.title not in seen_titles:
+            seen_titles.add(result.title)
+            unique_results.append(result)
+    
+    unique_results.sort(key=lambda x: x.relevance_score, reverse=True)
+    return unique_results[:limit]
+
+
+async def test_topic_search_matches_sequential_term_search():
+    engine = CongressSearchEngine(FakeClient())
+    terms = ["health", "medicare", "medicaid", "affordable care"]
+    
+    results = await engine.search_by_topic("healthcare", limit=80)
+    expected = await sequential_topic_search(engine, terms, 80)
+    
+    assert results
+    assert [(r.item_type, r.title, r.relevance_score) for r in results] == [
+        (r.item_type, r.title, r.relevance_score) for r in expected
+    ]
+
+
+async def test_topic_terms_run_concurrently_within_the_bound():
+    client = FakeClient(delay=0.01)
+    engine = CongressSearchEngine(client, concurrency=3)
+    
+    # Four terms, one search type each: only concurrent terms can overlap
+    await engine.search_by_topic("healthcare", item_types=["bill"], limit=80)
+    
+    assert client.max_in_flight == 3
+
+
+async def test_unknown_topic_is_searched_as_a_query():
+    engine = CongressSearchEngine(FakeClient())
+    
+    results = await engine.search_by_topic("highway", limit=8)
+    
+    assert [r.title for r in results] == ["HR 3: Highway Act"]
+
+
+def test_bill_table_scores_phrase_and_word_matches():
+    table = BillTable.from_bill_list(BillList.model_validate({"bills": [
+        {"title": "Health Care Act", "latestAction": {"text": "Referred to Health"}},
+        {"title": "Affordable Care Act"},
+        {"title": "Tax Act", "latestAction": {"text": "Passed"}},
+        {}
+    ]}))
+    
+    # Phrase in title 2.0, in action 1.0; each query word in title 0.5, in action 0.3
+    assert table.score("health") == [3.8, 0.0, 0.0, 0.0]
+    assert table.score("affordable care") == [0.5, 3.0, 0.0, 0.0]
+
+
+async def test_bill_results_keep_the_api_number_string():
+    engine = CongressSearchEngine(FakeClient())
+    
+    results = await engine._search_bills("health", limit=10)
+    
+    assert [r.title for r in results] == ["HR 1: Health Care Act"]
+    assert results[0].relevance_score == 3.8
+    assert results[0].chamber == "House"
+    assert results[0].metadata == {
+        "bill_type": "HR",
+        "number": "1",
+        "congress": 118,
+        "latest_action": "Referred to the Subcommittee on Health"
+    }
+
+
+async def test_search_all_scores_every_type():
+    engine = CongressSearchEngine(FakeClient())
+    
+    results = await engine.search_all("health", limit=20)
+    
+    assert [(r.item_type, r.title, r.relevance_score) for r in results] == [
+        ("bill", "HR 1: Health Care Act", 3.8),
+        ("committee", "Health, Education, Labor, and Pensions", 2.5),
+        ("member", "Healthy, Bob", 2.5)
+    ]
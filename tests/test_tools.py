@@ -0,0 +1,44 @@
+"""
+Tests for MCP tool argument validation.
+"""
+
+import pytest
+
+from congress_mcp.mcp_server.tools import register_tools, validate_tool_arguments
+
+
+@pytest.mark.parametrize("name, arguments", [
+    ("get_committee_details", {"system_code": "hsif00"}),
+    ("get_members", {"state": "CA", "chamber": "house"}),
+    ("get_member_details", {"bioguide_id": "A000370"}),
+    ("get_bills", {"bill_type": "hr"}),
+    ("search_by_topic", {"topic": "healthcare"}),
+    ("get_committees", {}),
+    ("get_committees", {"chamber": None}),
+    ("get_congress_info", {"anything": "goes"})
+])
+def test_accepts_valid_arguments(name, arguments):
+    validate_tool_arguments(name, arguments)
+
+
+@pytest.mark.parametrize("name, arguments", [
+    ("get_committee_details", {"system_code": "HSIF00"}),
+    ("get_committee_details", {"system_code": "hsif00; drop"}),
+    ("get_members", {"state": "California"}),
+    ("get_members", {"chamber": "joint"}),
+    ("get_member_details", {"bioguide_id": "a000370"}),
+    ("get_member_details", {"bioguide_id": 370}),
+    ("get_committees", {"chamber": "House"}),
+    ("get_bills", {"bill_type": "bogus"}),
+    ("search_by_topic", {"topic": "sports"})
+])
+def test_rejects_invalid_arguments(name, arguments):
+    with pytest.raises(ValueError, match="Invalid"):
+        validate_tool_arguments(name, arguments)
+
+
+async def test_register_tools_reuses_definitions():
+    tools = await register_tools()
+    
+    assert tools is await register_tools()
+    assert len({tool.name for tool in tools}) == len(tools)